@@ -208,6 +208,10 @@ def apply_cli_args_to_config(args, config_manager):
 
 def main():
     """Função principal"""
+    # Inicia a leitura do arquivo de configuração em background; o acesso a
+    # config_manager.config aguarda o carregamento terminar
+    config_manager = get_config_manager()
+
     parser = create_parser()
     args = parser.parse_args()
 
@@ -220,9 +224,6 @@ def main():
         device_manager.print_devices()
         return 0
 
-    # Gerenciador de configuração
-    config_manager = get_config_manager()
-
     # Reset de configuração se solicitado
     if args.reset_config:
         import shutil
@@ -26,6 +26,22 @@ def get_requirements():
     with open("requirements.txt", "r", encoding="utf-8") as fh:
         return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optional native build of the transcription/translation glue with mypyc.
+# Enable with WHISPER_MYPYC=1; without the compiled modules the pure Python
+# sources are imported as usual.
+def get_ext_modules():
+    if os.environ.get("WHISPER_MYPYC") != "1":
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypyc not installed, building pure Python package")
+        return []
+    return mypycify([
+        "src/transcription/whisper_engine.py",
+        "src/translation/engines.py",
+    ])
+
 setup(
     name="whisper-transcriber",
     version=get_version(),
@@ -36,6 +52,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/marcuspmd/whisper",
     packages=find_packages(),
+    ext_modules=get_ext_modules(),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
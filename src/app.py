@@ -38,12 +38,14 @@ class WhisperApplication:
 
     def __init__(self, use_simple_ui=False, headless=False):
         self.config_manager = get_config_manager()
+
+        # Enumera dispositivos enquanto o arquivo de configuração é carregado
+        self.device_manager = AudioDeviceManager()
         self.config = self.config_manager.config
         self.use_simple_ui = use_simple_ui
         self.headless = headless
 
         # Componentes principais
-        self.device_manager = AudioDeviceManager()
         self.audio_capture = None
         self.transcriber = None
         self.translation_manager = None
@@ -205,7 +207,10 @@ class WhisperApplication:
             self.transcriber = WhisperTranscriber(
                 model_name=self.config.transcription.model_name,
                 device=self.config.transcription.device,
+                compute_type=self.config.transcription.compute_type,
                 language=self.config.transcription.language,
+                cpu_threads=self.config.transcription.cpu_threads,
+                num_workers=self.config.transcription.num_workers,
             )
 
             logger.info("Sistema de transcrição configurado")
@@ -218,10 +223,17 @@ class WhisperApplication:
     def _setup_translation(self) -> bool:
         """Configura sistema de tradução"""
         try:
+            # Encerra a thread de lote do gerenciador anterior antes de recriá-lo
+            if self.translation_manager:
+                self.translation_manager.shutdown()
+                self.translation_manager = None
+
             if self.config.translation.enabled:
                 self.translation_manager = TranslationManager(
                     mode=self.config.translation.mode,
                     target_language=self.config.translation.target_language,
+                    onnx_model_dir=self.config.translation.onnx_model_dir,
+                    model_name=self.config.translation.model_name,
                 )
 
                 if self.translation_manager.is_available():
@@ -230,6 +242,7 @@ class WhisperApplication:
                     )
                 else:
                     logger.warning("Nenhum tradutor disponível")
+                    self.translation_manager.shutdown()
                     self.translation_manager = None
             else:
                 logger.info("Tradução desabilitada")
@@ -561,6 +574,10 @@ class WhisperApplication:
         if self.async_processor:
             self.async_processor.stop()
 
+        # Para a thread de lote da tradução
+        if self.translation_manager:
+            self.translation_manager.shutdown()
+
         # Para UI
         if self.ui:
             self.ui.stop()
@@ -2,31 +2,110 @@
 Audio device management
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import sounddevice as sd
 
+# Palavras-chave (minúsculas) de dispositivos virtuais e agregados que podem
+# funcionar como entrada mesmo sem canais de entrada explícitos
+_VIRTUAL_KEYWORDS = (
+    # Drivers virtuais tradicionais
+    "blackhole",
+    "loopback",
+    "virtual",
+    "soundflower",
+    "vb-audio",
+    "voicemeeter",
+    # Dispositivos agregados macOS
+    "aggregate",
+    "agregado",
+    "combined",
+    "conjunto",
+    # Dispositivos de múltiplas saídas
+    "múltipla",
+    "multiple",
+    "multi-output",
+    "multi output",
+    "multi-input",
+    # Software de áudio
+    "obs",
+    "rogue amoeba",
+    "audio hijack",
+    "lineout",
+    "line in",
+    "line out",
+    # Outros dispositivos especiais
+    "composite",
+    "mixer",
+    "routing",
+    "studio",
+    "interface",
+)
+
+# Agregados/múltiplas saídas que são aceitos quando expõem apenas canais de saída
+_AGGREGATE_KEYWORDS = (
+    "aggregate",
+    "agregado",
+    "múltipla",
+    "multiple",
+    "combined",
+    "conjunto",
+)
+
 
 class AudioDeviceManager:
     """Gerencia dispositivos de áudio do sistema"""
 
     def __init__(self):
         self._devices_cache = None
+        self._devices_are_dicts = True
 
     def list_devices(self) -> List[Dict[str, Any]]:
         """Lista todos os dispositivos de áudio disponíveis"""
         try:
             devices = sd.query_devices()
-            self._devices_cache = devices
-            return list(devices)
         except Exception:
             try:
                 devices = sd.devices
-                self._devices_cache = devices
-                return list(devices)
             except Exception as e:
                 raise RuntimeError(f"Erro ao consultar dispositivos de áudio: {e}")
 
+        self._devices_cache = devices
+        devices = list(devices)
+        # O sounddevice retorna sempre o mesmo tipo de item (dict ou objeto),
+        # então o tipo é verificado uma única vez por consulta
+        self._devices_are_dicts = bool(devices) and isinstance(devices[0], dict)
+        return devices
+
+    def _iter_device_fields(
+        self, devices: List[Any]
+    ) -> Iterator[Tuple[int, str, int, int]]:
+        """
+        Itera sobre os dispositivos extraindo os campos usados pelo gerenciador.
+
+        Args:
+            devices: Lista retornada por list_devices()
+
+        Yields:
+            Tuplas (id, nome, max_input_channels, max_output_channels)
+        """
+        if self._devices_are_dicts:
+            for idx, dev in enumerate(devices):
+                yield (
+                    idx,
+                    dev.get("name") or "",
+                    dev.get("max_input_channels") or 0,
+                    dev.get("max_output_channels") or 0,
+                )
+        else:
+            for idx, dev in enumerate(devices):
+                yield (
+                    idx,
+                    getattr(dev, "name", None) or "",
+                    getattr(dev, "max_input_channels", 0) or 0,
+                    getattr(dev, "max_output_channels", 0) or 0,
+                )
+
     def print_devices(self) -> None:
         """Imprime lista formatada de dispositivos"""
         try:
@@ -39,21 +118,7 @@ class AudioDeviceManager:
         print("ID  | Entradas | Saídas | Nome")
         print("-" * 50)
 
-        for idx, dev in enumerate(devices):
-            name = (
-                dev.get("name") if isinstance(dev, dict) else getattr(dev, "name", "")
-            )
-            max_in = (
-                dev.get("max_input_channels", 0)
-                if isinstance(dev, dict)
-                else getattr(dev, "max_input_channels", 0)
-            )
-            max_out = (
-                dev.get("max_output_channels", 0)
-                if isinstance(dev, dict)
-                else getattr(dev, "max_output_channels", 0)
-            )
-
+        for idx, name, max_in, max_out in self._iter_device_fields(devices):
             in_str = f"{max_in:2d}" if max_in > 0 else "--"
             out_str = f"{max_out:2d}" if max_out > 0 else "--"
 
@@ -75,27 +140,10 @@ class AudioDeviceManager:
         except RuntimeError:
             return None
 
-        candidates = []
-        for idx, dev in enumerate(devices):
-            name = (
-                dev.get("name") if isinstance(dev, dict) else getattr(dev, "name", None)
-            )
-            max_in = (
-                dev.get("max_input_channels")
-                if isinstance(dev, dict)
-                else getattr(dev, "max_input_channels", 0)
-            )
-
-            if (
-                name
-                and (name_substring.lower() in name.lower())
-                and max_in
-                and max_in > 0
-            ):
-                candidates.append((idx, name))
-
-        if candidates:
-            return candidates[0][0]
+        substring_lower = name_substring.lower()
+        for idx, name, max_in, _ in self._iter_device_fields(devices):
+            if name and substring_lower in name.lower() and max_in > 0:
+                return idx
         return None
 
     def find_device_by_id(self, device_id: int) -> Optional[Tuple[int, str, int]]:
@@ -112,16 +160,12 @@ class AudioDeviceManager:
             devices = self.list_devices()
             if 0 <= device_id < len(devices):
                 dev = devices[device_id]
-                name = (
-                    dev.get("name")
-                    if isinstance(dev, dict)
-                    else getattr(dev, "name", "")
-                )
-                max_in = (
-                    dev.get("max_input_channels", 0)
-                    if isinstance(dev, dict)
-                    else getattr(dev, "max_input_channels", 0)
-                )
+                if self._devices_are_dicts:
+                    name = dev.get("name", "")
+                    max_in = dev.get("max_input_channels", 0)
+                else:
+                    name = getattr(dev, "name", "")
+                    max_in = getattr(dev, "max_input_channels", 0)
                 return (device_id, name, max_in)
         except RuntimeError:
             pass
@@ -139,63 +183,14 @@ class AudioDeviceManager:
             devices = self.list_devices()
             input_devices = []
 
-            for idx, dev in enumerate(devices):
-                name = (
-                    dev.get("name")
-                    if isinstance(dev, dict)
-                    else getattr(dev, "name", "")
-                )
-                max_in = (
-                    dev.get("max_input_channels", 0)
-                    if isinstance(dev, dict)
-                    else getattr(dev, "max_input_channels", 0)
-                )
-                max_out = (
-                    dev.get("max_output_channels", 0)
-                    if isinstance(dev, dict)
-                    else getattr(dev, "max_output_channels", 0)
-                )
-
+            for idx, name, max_in, max_out in self._iter_device_fields(devices):
                 # Dispositivos com entrada explícita
                 has_input = max_in > 0
 
                 # Dispositivos virtuais e agregados baseado no nome (podem funcionar como entrada)
                 name_lower = name.lower()
                 is_virtual_or_aggregate = any(
-                    keyword in name_lower
-                    for keyword in [
-                        # Drivers virtuais tradicionais
-                        "blackhole",
-                        "loopback",
-                        "virtual",
-                        "soundflower",
-                        "vb-audio",
-                        "voicemeeter",
-                        # Dispositivos agregados macOS
-                        "aggregate",
-                        "agregado",
-                        "combined",
-                        "conjunto",
-                        # Dispositivos de múltiplas saídas
-                        "múltipla",
-                        "multiple",
-                        "multi-output",
-                        "multi output",
-                        "multi-input",
-                        # Software de áudio
-                        "obs",
-                        "rogue amoeba",
-                        "audio hijack",
-                        "lineout",
-                        "line in",
-                        "line out",
-                        # Outros dispositivos especiais
-                        "composite",
-                        "mixer",
-                        "routing",
-                        "studio",
-                        "interface",
-                    ]
+                    keyword in name_lower for keyword in _VIRTUAL_KEYWORDS
                 )
 
                 # Incluir se tem entrada OU se é dispositivo virtual/agregado OU tem saída (para agregados)
@@ -205,15 +200,7 @@ class AudioDeviceManager:
                     or (
                         max_out > 0
                         and any(
-                            keyword in name_lower
-                            for keyword in [
-                                "aggregate",
-                                "agregado",
-                                "múltipla",
-                                "multiple",
-                                "combined",
-                                "conjunto",
-                            ]
+                            keyword in name_lower for keyword in _AGGREGATE_KEYWORDS
                         )
                     )
                 ):
@@ -5,6 +5,7 @@ Configuration management and settings
 import json
 import logging
 import os
+import threading
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -38,6 +39,8 @@ class TranscriptionConfig:
     model_name: str = "base"
     device: str = "cpu"
     compute_type: str = "int8"
+    cpu_threads: Optional[int] = None  # None usa metade dos núcleos
+    num_workers: int = 1
     language: Optional[str] = None
     use_vad: bool = False
     vad_aggressiveness: int = 2
@@ -50,7 +53,9 @@ class TranslationConfig:
     enabled: bool = True
     mode: str = "local"  # "local" ou "google"
     target_language: str = "pt"
+    # Modelo MarianMT local; aceita checkpoints destilados (ex: 6 camadas)
     model_name: str = "Helsinki-NLP/opus-mt-en-pt"
+    onnx_model_dir: Optional[str] = None  # Modelo exportado para ONNX Runtime
 
 
 @dataclass
@@ -84,19 +89,52 @@ class ConfigManager:
 
         self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / "config.yaml"
-        self.config = AppConfig()
+        self._config = AppConfig()
+
+        # O arquivo é lido em background; o acesso a `config` aguarda a leitura,
+        # então quem cria o gerenciador cedo sobrepõe o I/O com outro trabalho
+        self._ready = threading.Event()
+        self._loader_thread = threading.Thread(
+            target=self._load_in_background, daemon=True
+        )
+        self._loader_thread.start()
+
+    @property
+    def config(self) -> AppConfig:
+        """Configuração atual (aguarda o carregamento do arquivo)"""
+        self._ready.wait()
+        return self._config
+
+    def _load_in_background(self) -> None:
+        """Cria diretório e carrega configurações fora do construtor"""
+        try:
+            # Cria diretório se não existir
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+
+            # Carrega configurações
+            self.load()
+        except Exception as e:
+            logger.error(f"Erro ao preparar diretório de configuração: {e}")
+        finally:
+            self._ready.set()
 
-        # Cria diretório se não existir
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o carregamento das configurações do arquivo.
 
-        # Carrega configurações
-        self.load()
+        Args:
+            timeout: Tempo máximo de espera em segundos (None aguarda indefinidamente)
+
+        Returns:
+            True se as configurações já foram carregadas
+        """
+        return self._ready.wait(timeout)
 
     def load(self) -> None:
         """Carrega configurações do arquivo"""
         if not self.config_file.exists():
             logger.info("Arquivo de configuração não encontrado, usando padrões")
-            self.save()  # Salva configurações padrão
+            self._save()  # Salva configurações padrão
             return
 
         try:
@@ -114,12 +152,17 @@ class ConfigManager:
 
     def save(self) -> None:
         """Salva configurações no arquivo"""
+        self._ready.wait()
+        self._save()
+
+    def _save(self) -> None:
+        """Grava a configuração atual (sem aguardar o carregamento)"""
         try:
             data = {
-                "audio": asdict(self.config.audio),
-                "transcription": asdict(self.config.transcription),
-                "translation": asdict(self.config.translation),
-                "ui": asdict(self.config.ui),
+                "audio": asdict(self._config.audio),
+                "transcription": asdict(self._config.transcription),
+                "translation": asdict(self._config.translation),
+                "ui": asdict(self._config.ui),
             }
 
             with open(self.config_file, "w", encoding="utf-8") as f:
@@ -135,23 +178,23 @@ class ConfigManager:
         try:
             if "audio" in data:
                 for key, value in data["audio"].items():
-                    if hasattr(self.config.audio, key):
-                        setattr(self.config.audio, key, value)
+                    if hasattr(self._config.audio, key):
+                        setattr(self._config.audio, key, value)
 
             if "transcription" in data:
                 for key, value in data["transcription"].items():
-                    if hasattr(self.config.transcription, key):
-                        setattr(self.config.transcription, key, value)
+                    if hasattr(self._config.transcription, key):
+                        setattr(self._config.transcription, key, value)
 
             if "translation" in data:
                 for key, value in data["translation"].items():
-                    if hasattr(self.config.translation, key):
-                        setattr(self.config.translation, key, value)
+                    if hasattr(self._config.translation, key):
+                        setattr(self._config.translation, key, value)
 
             if "ui" in data:
                 for key, value in data["ui"].items():
-                    if hasattr(self.config.ui, key):
-                        setattr(self.config.ui, key, value)
+                    if hasattr(self._config.ui, key):
+                        setattr(self._config.ui, key, value)
 
         except Exception as e:
             logger.error(f"Erro ao atualizar configuração: {e}")
@@ -170,5 +213,5 @@ def get_config_manager() -> ConfigManager:
 
 
 def get_config() -> AppConfig:
-    """Obtém configuração atual"""
+    """Obtém configuração atual (aguarda o carregamento do arquivo)"""
     return get_config_manager().config
@@ -7,6 +7,7 @@ import queue
 import threading
 import time
 import os
+from collections import deque
 from datetime import datetime
 from typing import Optional
 import numpy as np
@@ -23,8 +24,10 @@ class AsyncTranscriptionProcessor:
         self.ui = ui
         self.desktop_interface = desktop_interface
 
-        # Queue para processamento assíncrono
-        self.audio_queue = queue.Queue(maxsize=10)  # Máximo 10 chunks aguardando
+        # Fila circular para processamento assíncrono: quando cheia, descarta o
+        # chunk mais antigo para que a transcrição acompanhe a fala mais recente
+        self.audio_queue = deque(maxlen=10)  # Máximo 10 chunks aguardando
+        self._queue_cv = threading.Condition()
         self.result_queue = queue.Queue()
 
         # Thread de processamento
@@ -40,18 +43,28 @@ class AsyncTranscriptionProcessor:
         os.makedirs(backup_dir, exist_ok=True)
 
         # Nome do arquivo baseado no timestamp da sessão
-        session_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+        session_start = datetime.now()
+        session_time = session_start.strftime("%Y%m%d_%H%M%S")
         self.backup_file = os.path.join(backup_dir, f"transcription_{session_time}.txt")
 
         # Arquivo temporário para transcrição em andamento
         self.temp_file = os.path.join(backup_dir, "current_transcription.txt")
 
+        # Headers calculados uma única vez por sessão
+        started_at = session_start.strftime("%Y-%m-%d %H:%M:%S")
+        self._session_header = f"=== Sessão de Transcrição - {started_at} ===\n\n"
+        self._temp_header = f"=== Transcrição Atual - {started_at} ===\n\n"
+
+        # Últimas entradas mantidas em memória para reescrever o arquivo temporário
+        self._recent_entries = deque(maxlen=20)
+        self._backup_lock = threading.Lock()
+
         # Inicializa arquivos
         with open(self.backup_file, "w", encoding="utf-8") as f:
-            f.write(f"=== Sessão de Transcrição - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n\n")
+            f.write(self._session_header)
 
         with open(self.temp_file, "w", encoding="utf-8") as f:
-            f.write(f"=== Transcrição Atual - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n\n")
+            f.write(self._temp_header)
 
         logger.info(f"Backup de transcrição configurado: {self.backup_file}")
 
@@ -59,29 +72,21 @@ class AsyncTranscriptionProcessor:
         """Salva transcrição nos arquivos de backup"""
         try:
             timestamp = datetime.now().strftime("%H:%M:%S")
-            entry = f"[{timestamp}] {text}\n"
-
             if translation:
-                entry += f"[{timestamp}] (Tradução) {translation}\n"
-
-            entry += "\n"
-
-            # Salva no arquivo da sessão
-            with open(self.backup_file, "a", encoding="utf-8") as f:
-                f.write(entry)
-
-            # Atualiza arquivo temporário (mantém só as últimas 20 entradas)
-            with open(self.temp_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+                entry = f"[{timestamp}] {text}\n[{timestamp}] (Tradução) {translation}\n\n"
+            else:
+                entry = f"[{timestamp}] {text}\n\n"
 
-            # Mantém header + últimas 60 linhas (aprox. 20 entradas)
-            header_lines = lines[:2]  # Header
-            recent_lines = lines[-58:] if len(lines) > 60 else lines[2:]
+            with self._backup_lock:
+                # Salva no arquivo da sessão
+                with open(self.backup_file, "a", encoding="utf-8") as f:
+                    f.write(entry)
 
-            with open(self.temp_file, "w", encoding="utf-8") as f:
-                f.writelines(header_lines)
-                f.writelines(recent_lines)
-                f.write(entry)
+                # Atualiza arquivo temporário (mantém só as últimas 20 entradas)
+                self._recent_entries.append(entry)
+                with open(self.temp_file, "w", encoding="utf-8") as f:
+                    f.write(self._temp_header)
+                    f.writelines(self._recent_entries)
 
         except Exception as e:
             logger.error(f"Erro ao salvar backup de transcrição: {e}")
@@ -95,41 +100,48 @@ class AsyncTranscriptionProcessor:
 
     def stop(self):
         """Para processador assíncrono"""
-        self.is_running = False
+        with self._queue_cv:
+            self.is_running = False
+            self._queue_cv.notify_all()
         if self.processing_thread:
             self.processing_thread.join(timeout=2)
         logger.info("Processador assíncrono de transcrição parado")
 
     def add_audio_chunk(self, audio_data: np.ndarray, sample_rate: int) -> bool:
         """
-        Adiciona chunk de áudio para processamento assíncrono
+        Adiciona chunk de áudio para processamento assíncrono.
+
+        Se a fila estiver cheia, o chunk mais antigo é descartado para manter
+        a latência da transcrição limitada.
 
         Returns:
-            True se adicionado com sucesso, False se queue está cheia
+            True (o chunk mais recente é sempre enfileirado)
         """
-        try:
-            # Adiciona com timeout para evitar bloqueio
-            self.audio_queue.put((audio_data, sample_rate), timeout=0.1)
-            return True
-        except queue.Full:
-            logger.warning("Queue de transcrição cheia - descartando chunk de áudio")
-            return False
+        with self._queue_cv:
+            if len(self.audio_queue) == self.audio_queue.maxlen:
+                self.audio_queue.popleft()
+                logger.warning(
+                    "Queue de transcrição cheia - descartando chunk de áudio mais antigo"
+                )
+            self.audio_queue.append((audio_data, sample_rate))
+            self._queue_cv.notify()
+        return True
 
     def _processing_loop(self):
         """Loop principal de processamento de transcrição"""
         while self.is_running:
             try:
-                # Obtém próximo chunk com timeout
-                audio_data, sample_rate = self.audio_queue.get(timeout=1.0)
+                # Aguarda próximo chunk com timeout
+                with self._queue_cv:
+                    if not self.audio_queue:
+                        self._queue_cv.wait(timeout=1.0)
+                    if not self.audio_queue:
+                        continue
+                    audio_data, sample_rate = self.audio_queue.popleft()
 
                 # Processa transcrição
                 self._process_transcription_chunk(audio_data, sample_rate)
 
-                # Marca como processado
-                self.audio_queue.task_done()
-
-            except queue.Empty:
-                continue
             except Exception as e:
                 logger.error(f"Erro no processamento assíncrono: {e}")
                 time.sleep(0.1)
@@ -201,4 +213,5 @@ class AsyncTranscriptionProcessor:
 
     def get_queue_size(self) -> int:
         """Retorna tamanho atual da queue"""
-        return self.audio_queue.qsize()
+        with self._queue_cv:
+            return len(self.audio_queue)
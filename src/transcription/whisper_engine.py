@@ -2,18 +2,125 @@
 Whisper transcription engine
 """
 
+import functools
 import logging
-import os
-import tempfile
 from collections import deque
-from typing import List, Optional
+from typing import Deque, List, Optional, Set
 
 import numpy as np
-import soundfile as sf
 from faster_whisper import WhisperModel
 
+from ..utils.threads import half_cpu_count
+
 logger = logging.getLogger(__name__)
 
+# Taxa de amostragem esperada pelo faster-whisper para entrada em memória
+WHISPER_SAMPLE_RATE = 16000
+
+# Pico de amplitude (áudio normalizado) abaixo do qual o chunk é tratado como silêncio
+SILENCE_PEAK_THRESHOLD = 1e-3
+
+# Fator de normalização int16 -> float32 em [-1, 1]
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _to_whisper_input(
+    audio_data: np.ndarray, sample_rate: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Converte áudio para o formato aceito pelo faster-whisper (float32 mono 16 kHz).
+
+    Args:
+        audio_data: Dados de áudio (int16 ou float)
+        sample_rate: Taxa de amostragem original
+        out: Buffer float32 reutilizável com pelo menos len(audio_data) amostras
+
+    Returns:
+        Array float32 normalizado entre -1 e 1
+    """
+    # Primeiro canal apenas
+    if audio_data.ndim > 1:
+        audio_data = audio_data[:, 0]
+
+    if audio_data.dtype == np.int16:
+        # Conversão + normalização em uma única passada vetorizada (float32)
+        audio = (
+            out[: audio_data.size]
+            if out is not None
+            else np.empty(audio_data.size, dtype=np.float32)
+        )
+        np.multiply(
+            audio_data, _INT16_SCALE, out=audio, dtype=np.float32, casting="unsafe"
+        )
+    elif audio_data.dtype == np.float32:
+        audio = audio_data
+    elif out is not None:
+        audio = out[: audio_data.size]
+        np.copyto(audio, audio_data, casting="unsafe")
+    else:
+        audio = audio_data.astype(np.float32)
+
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        try:
+            from scipy.signal import resample_poly
+
+            audio = resample_poly(audio, WHISPER_SAMPLE_RATE, sample_rate).astype(
+                np.float32, copy=False
+            )
+        except ImportError:
+            # Fallback sem scipy: interpolação linear
+            num_samples = int(len(audio) * WHISPER_SAMPLE_RATE / sample_rate)
+            positions = np.linspace(0, len(audio) - 1, num_samples)
+            audio = np.interp(positions, np.arange(len(audio)), audio).astype(
+                np.float32
+            )
+
+    return audio
+
+
+@functools.lru_cache(maxsize=4)
+def _load_whisper_model(
+    model_name: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int,
+    num_workers: int,
+) -> WhisperModel:
+    """Carrega modelo Whisper uma única vez por combinação de parâmetros"""
+    model = WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+    _warm_up_model(model)
+    return model
+
+
+def _warm_up_model(model: WhisperModel) -> None:
+    """
+    Executa uma inferência com 1s de silêncio para pré-aquecer o modelo.
+
+    A primeira chamada ao CTranslate2 seleciona kernels e aloca buffers,
+    ficando várias vezes mais lenta; isso é feito aqui em vez de na
+    primeira fala do usuário.
+    """
+    try:
+        silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+        segments, _ = model.transcribe(
+            silence,
+            beam_size=1,
+            best_of=1,
+            temperature=0.0,
+            without_timestamps=True,
+        )
+        # Segmentos são gerados sob demanda: consome para executar o decoder
+        for _ in segments:
+            pass
+    except Exception as e:
+        logger.debug(f"Pré-aquecimento do modelo ignorado: {e}")
+
 
 class TranscriptionResult:
     """Resultado de transcrição"""
@@ -27,7 +134,7 @@ class TranscriptionResult:
         self.text = text
         self.language = language
         self.confidence = confidence
-        self.timestamp = None
+        self.timestamp: Optional[str] = None
 
     def __str__(self) -> str:
         return self.text
@@ -45,22 +152,38 @@ class WhisperTranscriber:
         device: str = "cpu",
         compute_type: str = "int8",
         language: Optional[str] = None,
+        cpu_threads: Optional[int] = None,
+        num_workers: int = 1,
     ):
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
         self.language = language
-        self.model = None
-        self.recent_texts = deque(maxlen=5)
+        self.cpu_threads = cpu_threads or half_cpu_count()
+        self.num_workers = num_workers
+        self.model: Optional[WhisperModel] = None
+        self.recent_texts: Deque[str] = deque(maxlen=5)
+        # Versões minúsculas dos textos recentes para deduplicação em O(1)
+        self._recent_lower: Deque[str] = deque(maxlen=5)
+        self._recent_lower_set: Set[str] = set()
+        # Buffer float32 reaproveitado entre chamadas de transcribe_audio
+        self._audio_buf: Optional[np.ndarray] = None
 
         self._load_model()
 
     def _load_model(self) -> None:
         """Carrega o modelo Whisper"""
         try:
-            logger.info(f"Carregando modelo Whisper: {self.model_name}")
-            self.model = WhisperModel(
-                self.model_name, device=self.device, compute_type=self.compute_type
+            logger.info(
+                f"Carregando modelo Whisper: {self.model_name} "
+                f"({self.compute_type}, {self.cpu_threads} threads)"
+            )
+            self.model = _load_whisper_model(
+                self.model_name,
+                self.device,
+                self.compute_type,
+                self.cpu_threads,
+                self.num_workers,
             )
             logger.info("Modelo carregado com sucesso")
         except Exception as e:
@@ -87,12 +210,19 @@ class WhisperTranscriber:
         if len(audio_data) == 0:
             return None
 
-        # Salva áudio temporário
-        temp_path = None
         try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                temp_path = tmp.name
-                sf.write(temp_path, audio_data, sample_rate, subtype="PCM_16")
+            # Passa o áudio em memória, sem arquivo WAV intermediário
+            # float32 é usado direto; o buffer só serve às conversões de tipo
+            out = None
+            if audio_data.dtype != np.float32:
+                if self._audio_buf is None or self._audio_buf.size < len(audio_data):
+                    self._audio_buf = np.empty(len(audio_data), dtype=np.float32)
+                out = self._audio_buf
+            audio = _to_whisper_input(audio_data, sample_rate, out=out)
+
+            # Chunk praticamente silencioso: não executa o modelo
+            if np.max(np.abs(audio)) < SILENCE_PEAK_THRESHOLD:
+                return None
 
             # Parâmetros de transcrição otimizados para tempo real
             transcribe_params = {
@@ -100,13 +230,23 @@ class WhisperTranscriber:
                 "best_of": 1,
                 "temperature": 0.0,
                 "condition_on_previous_text": False,
+                # Só o texto é usado: sem tokens de timestamp nem por palavra
+                "without_timestamps": True,
+                "word_timestamps": False,
+                "suppress_blank": True,
+                # Silero VAD remove trechos silenciosos antes do encoder
+                "vad_filter": True,
+                "vad_parameters": {
+                    "min_silence_duration_ms": 300,
+                    "speech_pad_ms": 100,
+                },
             }
 
             if self.language:
                 transcribe_params["language"] = self.language
 
             # Transcreve
-            segments, info = self.model.transcribe(temp_path, **transcribe_params)
+            segments, info = self.model.transcribe(audio, **transcribe_params)
 
             # Processa segmentos
             for segment in segments:
@@ -115,10 +255,11 @@ class WhisperTranscriber:
                     continue
 
                 # Evita repetições
-                if text.lower() in [r.lower() for r in self.recent_texts]:
+                text_lower = text.lower()
+                if text_lower in self._recent_lower_set:
                     continue
 
-                self.recent_texts.append(text)
+                self._remember_text(text, text_lower)
 
                 return TranscriptionResult(
                     text=text,
@@ -132,13 +273,15 @@ class WhisperTranscriber:
             logger.error(f"Erro na transcrição: {e}")
             return None
 
-        finally:
-            # Limpa arquivo temporário
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception as e:
-                    logger.warning(f"Erro ao remover arquivo temporário: {e}")
+    def _remember_text(self, text: str, text_lower: str) -> None:
+        """Registra texto recente mantendo deque e set sincronizados"""
+        # Textos repetidos nunca entram, então o mais antigo é único no set
+        if len(self._recent_lower) == self._recent_lower.maxlen:
+            self._recent_lower_set.discard(self._recent_lower[0])
+
+        self.recent_texts.append(text)
+        self._recent_lower.append(text_lower)
+        self._recent_lower_set.add(text_lower)
 
     def set_language(self, language: Optional[str]) -> None:
         """Define idioma para transcrição"""
@@ -172,7 +315,17 @@ class WhisperTranscriber:
 
 
 def create_transcriber(
-    model_name: str = "base", device: str = "cpu", language: Optional[str] = None
+    model_name: str = "base",
+    device: str = "cpu",
+    language: Optional[str] = None,
+    cpu_threads: Optional[int] = None,
+    num_workers: int = 1,
 ) -> WhisperTranscriber:
     """Factory function para criar transcriber"""
-    return WhisperTranscriber(model_name=model_name, device=device, language=language)
+    return WhisperTranscriber(
+        model_name=model_name,
+        device=device,
+        language=language,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
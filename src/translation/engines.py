@@ -2,9 +2,18 @@
 Translation engines and utilities
 """
 
+import functools
 import logging
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.threads import half_cpu_count
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +30,40 @@ class TranslationResult:
         self.translated_text = translated_text
         self.source_language = source_language
         self.target_language = target_language
-        self.confidence = None
+        self.confidence: Optional[float] = None
 
     def __str__(self) -> str:
         return self.translated_text
 
 
+def _base_language(language: str) -> str:
+    """Retorna o código base do idioma (ex: "pt-BR" -> "pt")"""
+    return language.split("-")[0].lower()
+
+
+_torch_threads_configured = False
+
+
+def _configure_torch_threads(torch: Any) -> None:
+    """Configura número de threads do PyTorch uma única vez por processo"""
+    global _torch_threads_configured
+    if not _torch_threads_configured:
+        torch.set_num_threads(half_cpu_count())
+        _torch_threads_configured = True
+
+
 class BaseTranslator(ABC):
     """Interface base para tradutores"""
 
+    # Número máximo de traduções mantidas em cache (LRU)
+    MAX_CACHE_SIZE = 1024
+
     def __init__(self, target_language: str = "pt"):
         self.target_language = target_language
-        self.cache = {}  # Cache simples de traduções
+        self.cache: "OrderedDict[Tuple[str, str, str], TranslationResult]" = (
+            OrderedDict()
+        )  # Cache LRU de traduções
+        self._cache_lock = threading.Lock()
 
     @abstractmethod
     def translate(
@@ -41,23 +72,43 @@ class BaseTranslator(ABC):
         """Traduz texto"""
         pass
 
-    def _get_cache_key(self, text: str, source_lang: Optional[str]) -> str:
-        """Gera chave para cache"""
-        return f"{source_lang or 'auto'}_{self.target_language}_{text}"
+    def translate_batch(
+        self, texts: List[str], source_language: Optional[str] = None
+    ) -> List[Optional[TranslationResult]]:
+        """Traduz vários textos (implementação padrão: um por vez)"""
+        return [self.translate(text, source_language) for text in texts]
+
+    def _get_cache_key(
+        self, text: str, source_lang: Optional[str]
+    ) -> Tuple[str, str, str]:
+        """Gera chave para cache (tupla, sem concatenar o texto)"""
+        return (source_lang or "auto", self.target_language, text)
 
     def _get_cached(
         self, text: str, source_language: Optional[str]
     ) -> Optional[TranslationResult]:
         """Obtém tradução do cache"""
         key = self._get_cache_key(text, source_language)
-        return self.cache.get(key)
+        with self._cache_lock:
+            result = self.cache.get(key)
+            if result is not None:
+                self.cache.move_to_end(key)
+            return result
 
     def _cache_result(
         self, text: str, source_language: Optional[str], result: TranslationResult
     ) -> None:
         """Armazena resultado no cache"""
         key = self._get_cache_key(text, source_language)
-        self.cache[key] = result
+        with self._cache_lock:
+            self.cache[key] = result
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.MAX_CACHE_SIZE:
+                self.cache.popitem(last=False)
+
+
+# Timeout das requisições ao Google Translate
+GOOGLE_TIMEOUT_SECONDS = 5.0
 
 
 class GoogleTranslator(BaseTranslator):
@@ -65,7 +116,7 @@ class GoogleTranslator(BaseTranslator):
 
     def __init__(self, target_language: str = "pt"):
         super().__init__(target_language)
-        self.translator = None
+        self.translator: Any = None
         self._initialize()
 
     def _initialize(self) -> None:
@@ -73,7 +124,9 @@ class GoogleTranslator(BaseTranslator):
         try:
             from googletrans import Translator
 
-            self.translator = Translator()
+            # Um único Translator por instância: o cliente httpx interno mantém
+            # conexões HTTP/2 keep-alive entre chamadas
+            self.translator = Translator(http2=True, timeout=GOOGLE_TIMEOUT_SECONDS)
             logger.info("Google Translator inicializado")
         except ImportError:
             logger.error("googletrans não disponível")
@@ -128,6 +181,101 @@ class GoogleTranslator(BaseTranslator):
             return None
 
 
+@functools.lru_cache(maxsize=4)
+def _load_marian(
+    model_name: str, onnx_model_dir: Optional[str] = None
+) -> Tuple[Any, Any]:
+    """
+    Carrega tokenizer e modelo MarianMT uma única vez por combinação de parâmetros.
+
+    Args:
+        model_name: Nome do modelo no Hugging Face Hub
+        onnx_model_dir: Diretório do modelo exportado para ONNX (opcional)
+
+    Returns:
+        Tupla (tokenizer, model)
+    """
+    import torch
+    from transformers import MarianMTModel, MarianTokenizer
+
+    _configure_torch_threads(torch)
+
+    logger.info(f"Carregando modelo local: {model_name}")
+    tokenizer = MarianTokenizer.from_pretrained(model_name)
+
+    # Prefere o modelo exportado para ONNX Runtime quando configurado
+    if onnx_model_dir:
+        onnx_model = _load_marian_onnx(onnx_model_dir)
+        if onnx_model is not None:
+            return tokenizer, onnx_model
+
+    model = MarianMTModel.from_pretrained(model_name)
+    model.eval()
+
+    # Quantização dinâmica int8 das camadas Linear (inferência em CPU).
+    # Vem antes do BetterTransformer, que substitui as camadas do encoder por
+    # módulos fundidos e esconderia os nn.Linear da quantização
+    model = torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+    # Atenção/LayerNorm fundidas quando optimum está disponível. A conversão
+    # trabalha sobre uma cópia: se falhar no meio, o modelo int8 fica intacto
+    try:
+        from optimum.bettertransformer import BetterTransformer
+
+        model = BetterTransformer.transform(model, keep_original_model=True)
+        logger.info("BetterTransformer aplicado ao modelo local")
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.info(f"BetterTransformer não aplicado ao modelo int8: {e}")
+
+    logger.info("Modelo local carregado com sucesso (int8 dinâmico)")
+    return tokenizer, model
+
+
+def _load_marian_onnx(onnx_model_dir: str) -> Optional[Any]:
+    """
+    Carrega o modelo exportado para ONNX Runtime (optimum).
+
+    O modelo deve ser exportado e quantizado previamente, por exemplo:
+
+        optimum-cli export onnx --model Helsinki-NLP/opus-mt-en-pt \\
+            --task text2text-generation-with-past out/
+        optimum-cli onnxruntime quantize --avx512_vnni \\
+            --onnx_model out/ -o out-int8/
+
+    Returns:
+        Modelo ONNX ou None para usar o modelo PyTorch
+    """
+    try:
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError:
+        logger.warning("optimum[onnxruntime] não disponível, usando PyTorch")
+        return None
+
+    try:
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        session_options.intra_op_num_threads = half_cpu_count()
+
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            onnx_model_dir,
+            provider="CPUExecutionProvider",
+            session_options=session_options,
+        )
+        logger.info(f"Modelo ONNX carregado de {onnx_model_dir}")
+        return model
+
+    except Exception as e:
+        logger.warning(f"Erro ao carregar modelo ONNX, usando PyTorch: {e}")
+        return None
+
+
 class LocalTranslator(BaseTranslator):
     """Tradutor local usando transformers"""
 
@@ -135,22 +283,21 @@ class LocalTranslator(BaseTranslator):
         self,
         target_language: str = "pt",
         model_name: str = "Helsinki-NLP/opus-mt-en-pt",
+        onnx_model_dir: Optional[str] = None,
     ):
         super().__init__(target_language)
         self.model_name = model_name
-        self.tokenizer = None
-        self.model = None
+        self.onnx_model_dir = onnx_model_dir
+        self.tokenizer: Any = None
+        self.model: Any = None
         self._initialize()
 
     def _initialize(self) -> None:
-        """Inicializa modelo local"""
+        """Inicializa modelo local (compartilhado entre instâncias)"""
         try:
-            from transformers import MarianMTModel, MarianTokenizer
-
-            logger.info(f"Carregando modelo local: {self.model_name}")
-            self.tokenizer = MarianTokenizer.from_pretrained(self.model_name)
-            self.model = MarianMTModel.from_pretrained(self.model_name)
-            logger.info("Modelo local carregado com sucesso")
+            self.tokenizer, self.model = _load_marian(
+                self.model_name, self.onnx_model_dir
+            )
 
         except ImportError:
             logger.error("transformers não disponível")
@@ -175,60 +322,217 @@ class LocalTranslator(BaseTranslator):
         if not text.strip():
             return None
 
-        # Verifica cache
-        cached = self._get_cached(text, source_language)
-        if cached:
-            return cached
-
-        if self.model is None or self.tokenizer is None:
-            logger.error("Modelo local não inicializado")
-            return None
-
-        try:
-            # Tokeniza
-            inputs = self.tokenizer(text, return_tensors="pt", padding=True)
+        return self.translate_batch([text], source_language)[0]
 
-            # Gera tradução
-            tokens = self.model.generate(**inputs)
+    def translate_batch(
+        self, texts: List[str], source_language: Optional[str] = None
+    ) -> List[Optional[TranslationResult]]:
+        """
+        Traduz vários textos com uma única chamada ao modelo.
 
-            # Decodifica
-            translated = self.tokenizer.decode(tokens[0], skip_special_tokens=True)
+        Args:
+            texts: Textos para traduzir
+            source_language: Idioma de origem (ignorado no modelo local)
 
-            translation_result = TranslationResult(
-                translated_text=translated,
-                source_language="en",  # Modelo específico en->pt
-                target_language=self.target_language,
-            )
+        Returns:
+            Lista de resultados na mesma ordem de texts (None se erro)
+        """
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+
+        # Verifica cache antes de montar o lote
+        pending = []
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+            cached = self._get_cached(text, source_language)
+            if cached:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        if not pending:
+            return results
 
-            # Cache resultado
-            self._cache_result(text, source_language, translation_result)
+        if self.model is None or self.tokenizer is None:
+            logger.error("Modelo local não inicializado")
+            return results
 
-            return translation_result
+        try:
+            import torch
+
+            # Sem rastreamento de autograd durante a inferência
+            with torch.inference_mode():
+                # Tokeniza o lote com padding
+                inputs = self.tokenizer(
+                    [texts[i] for i in pending],
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                )
+
+                # Gera traduções (greedy)
+                tokens = self.model.generate(**inputs, num_beams=1)
+
+                # Decodifica
+                translations = self.tokenizer.batch_decode(
+                    tokens, skip_special_tokens=True
+                )
+
+            for i, translated in zip(pending, translations):
+                translation_result = TranslationResult(
+                    translated_text=translated,
+                    source_language="en",  # Modelo específico en->pt
+                    target_language=self.target_language,
+                )
+
+                # Cache resultado
+                self._cache_result(texts[i], source_language, translation_result)
+                results[i] = translation_result
 
         except Exception as e:
             logger.error(f"Erro na tradução local: {e}")
-            return None
+
+        return results
 
 
 class TranslationManager:
     """Gerenciador de tradução com fallbacks"""
 
-    def __init__(self, mode: str = "local", target_language: str = "pt"):
+    # Tempo máximo de espera por um lote antes de traduzir diretamente (segundos)
+    BATCH_RESULT_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        mode: str = "local",
+        target_language: str = "pt",
+        onnx_model_dir: Optional[str] = None,
+        model_name: str = "Helsinki-NLP/opus-mt-en-pt",
+    ):
         self.mode = mode
         self.target_language = target_language
-        self.primary_translator = None
-        self.fallback_translator = None
+        self.onnx_model_dir = onnx_model_dir
+        self.model_name = model_name
+        self.primary_translator: Optional[BaseTranslator] = None
+        self.fallback_translator: Optional[BaseTranslator] = None
         self.enabled = True
 
+        # Agrupa textos que chegam próximos para traduzi-los em lote
+        self.batch_window = 0.05  # segundos
+        self.max_batch_size = 8
+        self._batch_queue = queue.Queue()
+        self._batch_thread: Optional[threading.Thread] = None
+
+        # Traduções em andamento, para não repetir a mesma chamada em paralelo
+        self._in_flight: Dict[Tuple[Optional[str], str], Future] = {}
+        self._in_flight_lock = threading.Lock()
+
         self._setup_translators()
 
+        if isinstance(self.primary_translator, LocalTranslator):
+            self._batch_thread = threading.Thread(
+                target=self._batch_loop, daemon=True
+            )
+            self._batch_thread.start()
+
+    def _batch_loop(self) -> None:
+        """Coleta traduções pendentes e despacha em lote para o tradutor primário
+
+        Um None na fila (enviado por shutdown) encerra o loop.
+        """
+        stopping = False
+        while not stopping:
+            item = self._batch_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._batch_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # Agrupa por idioma de origem (faz parte da chave de cache)
+            groups: Dict[Optional[str], List[Any]] = {}
+            for item in batch:
+                groups.setdefault(item[1], []).append(item)
+
+            for source_language, items in groups.items():
+                try:
+                    results = self.primary_translator.translate_batch(
+                        [text for text, _, _ in items], source_language
+                    )
+                except Exception as e:
+                    # Quem aguarda recebe o erro e traduz diretamente
+                    logger.warning(f"Erro no lote do tradutor primário: {e}")
+                    for _, _, future in items:
+                        future.set_exception(e)
+                    continue
+
+                for (_, _, future), result in zip(items, results):
+                    future.set_result(result)
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Encerra a thread de lote; traduções seguintes são feitas diretamente"""
+        thread = self._batch_thread
+        if thread is None:
+            return
+
+        self._batch_thread = None
+        self._batch_queue.put(None)
+        thread.join(timeout=timeout)
+
+        # Pedidos que chegaram depois do sinal de parada não serão processados
+        while True:
+            try:
+                item = self._batch_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[2].set_exception(RuntimeError("Tradução em lote encerrada"))
+
+    def _translate_primary(
+        self, text: str, source_language: Optional[str]
+    ) -> Optional[TranslationResult]:
+        """Traduz com o tradutor primário, em lote quando suportado"""
+        batch_thread = self._batch_thread
+        if batch_thread is None or not batch_thread.is_alive():
+            return self.primary_translator.translate(text, source_language)
+
+        # Cache é consultado antes de enfileirar
+        cached = self.primary_translator._get_cached(text, source_language)
+        if cached:
+            return cached
+
+        future: Future = Future()
+        self._batch_queue.put((text, source_language, future))
+        try:
+            return future.result(timeout=self.BATCH_RESULT_TIMEOUT)
+        except FutureTimeoutError:
+            logger.warning("Lote de tradução não respondeu; traduzindo diretamente")
+        except Exception as e:
+            logger.warning(f"Lote de tradução falhou ({e}); traduzindo diretamente")
+        return self.primary_translator.translate(text, source_language)
+
     def _setup_translators(self) -> None:
         """Configura tradutores primário e fallback"""
         try:
             if self.mode == "local":
                 # Tenta modelo local primeiro
                 try:
-                    self.primary_translator = LocalTranslator(self.target_language)
+                    self.primary_translator = LocalTranslator(
+                        self.target_language,
+                        model_name=self.model_name,
+                        onnx_model_dir=self.onnx_model_dir,
+                    )
                     logger.info("Tradutor local configurado como primário")
                 except Exception as e:
                     logger.warning(f"Erro no tradutor local: {e}")
@@ -265,15 +569,64 @@ class TranslationManager:
             source_language: Idioma de origem
 
         Returns:
-            Resultado da tradução ou None
+            Resultado da tradução ou None (inclusive quando o resultado seria
+            idêntico ao texto original)
         """
         if not self.enabled or not text.strip():
             return None
 
+        # Texto já está no idioma de destino: não há o que traduzir
+        if source_language and _base_language(source_language) == _base_language(
+            self.target_language
+        ):
+            return None
+
+        # Chamadas concorrentes com o mesmo texto aguardam a primeira
+        key = (source_language, text)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_owner:
+            try:
+                return future.result(timeout=self.BATCH_RESULT_TIMEOUT)
+            except FutureTimeoutError:
+                logger.warning("Tradução concorrente não respondeu; refazendo")
+                return self._drop_identity(
+                    text, self._translate_uncoalesced(text, source_language)
+                )
+
+        result = None
+        try:
+            result = self._drop_identity(
+                text, self._translate_uncoalesced(text, source_language)
+            )
+            return result
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            future.set_result(result)
+
+    @staticmethod
+    def _drop_identity(
+        text: str, result: Optional[TranslationResult]
+    ) -> Optional[TranslationResult]:
+        """Descarta tradução idêntica ao original (apareceria em duplicata)"""
+        if result and result.translated_text.strip() == text.strip():
+            return None
+        return result
+
+    def _translate_uncoalesced(
+        self, text: str, source_language: Optional[str]
+    ) -> Optional[TranslationResult]:
+        """Traduz com tradutor primário e, se falhar, com o fallback"""
         # Tenta tradutor primário
         if self.primary_translator:
             try:
-                result = self.primary_translator.translate(text, source_language)
+                result = self._translate_primary(text, source_language)
                 if result:
                     return result
             except Exception as e:
@@ -304,7 +657,10 @@ class TranslationManager:
 
 
 def create_translation_manager(
-    mode: str = "local", target_language: str = "pt"
+    mode: str = "local",
+    target_language: str = "pt",
+    onnx_model_dir: Optional[str] = None,
+    model_name: str = "Helsinki-NLP/opus-mt-en-pt",
 ) -> TranslationManager:
     """
     Factory function para criar gerenciador de tradução.
@@ -312,8 +668,15 @@ def create_translation_manager(
     Args:
         mode: Modo de tradução ("local" ou "google")
         target_language: Idioma de destino
+        onnx_model_dir: Diretório do modelo local exportado para ONNX (opcional)
+        model_name: Modelo MarianMT local (ex: um aluno destilado menor)
 
     Returns:
         Gerenciador de tradução configurado
     """
-    return TranslationManager(mode=mode, target_language=target_language)
+    return TranslationManager(
+        mode=mode,
+        target_language=target_language,
+        onnx_model_dir=onnx_model_dir,
+        model_name=model_name,
+    )
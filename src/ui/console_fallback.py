@@ -3,7 +3,9 @@ Console minimalista para fallback quando GUI não está disponível
 """
 
 import logging
-from datetime import datetime
+import sys
+import threading
+import time
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -12,9 +14,14 @@ logger = logging.getLogger(__name__)
 class ConsoleFallback:
     """Interface console extremamente simples para casos de emergência"""
 
+    # Último timestamp formatado (reaproveitado dentro do mesmo segundo)
+    _last_second: int = -1
+    _last_timestamp: str = ""
+
     def __init__(self, config=None):
         self.config = config
         self.is_running = False
+        self._stop_event = threading.Event()
         print("🎤 Whisper Transcriber - Modo Console")
         print("Pressione Ctrl+C para sair")
 
@@ -25,11 +32,20 @@ class ConsoleFallback:
         language: Optional[str] = None,
     ):
         """Adiciona nova transcrição"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._format_timestamp()
         if translated:
-            print(f"[{timestamp}] {original} ➜ {translated}")
+            sys.stdout.write(f"[{timestamp}] {original} ➜ {translated}\n")
         else:
-            print(f"[{timestamp}] {original}")
+            sys.stdout.write(f"[{timestamp}] {original}\n")
+
+    def _format_timestamp(self) -> str:
+        """Retorna HH:MM:SS atual, reformatando só quando o segundo muda"""
+        now = time.time()
+        second = int(now)
+        if second != self._last_second:
+            self._last_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_second = second
+        return self._last_timestamp
 
     def update_audio_level(self, level: float):
         """Atualiza nível de áudio (ignorado no console)"""
@@ -53,15 +69,16 @@ class ConsoleFallback:
 
     def start(self):
         """Inicia interface"""
+        self._stop_event.clear()
         self.is_running = True
         try:
-            # Aguarda infinitamente (será interrompido por Ctrl+C)
-            import time
-            while self.is_running:
-                time.sleep(1)
+            # Bloqueia até stop(); o timeout mantém Ctrl+C funcionando no Windows
+            while not self._stop_event.wait(timeout=0.5):
+                pass
         except KeyboardInterrupt:
             pass
 
     def stop(self):
         """Para interface"""
         self.is_running = False
+        self._stop_event.set()
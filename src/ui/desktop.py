@@ -3,19 +3,137 @@ Interface desktop usando Tkinter para Whisper Transcriber.
 """
 
 import logging
+import os
+import queue
+import re
 import threading
 import time
 import tkinter as tk
+import tkinter.font as tkfont
+from collections import Counter, deque
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime
-from tkinter import messagebox, scrolledtext, ttk
-from typing import Any, Dict, List, Optional
+from tkinter import colorchooser, filedialog, messagebox, scrolledtext, ttk
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from ..audio.device_manager import AudioDeviceManager
+except (ImportError, OSError):  # sounddevice/PortAudio ausente
+    AudioDeviceManager = None
 
 logger = logging.getLogger(__name__)
 
 
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compila uma alternância de palavras-chave literais."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Categorias de dispositivos de áudio, na ordem de prioridade
+_DEVICE_CATEGORIES = (
+    (
+        _keyword_pattern(
+            "blackhole", "loopback", "soundflower", "vb-audio", "voicemeeter"
+        ),
+        " [Virtual Audio]",
+    ),
+    (
+        _keyword_pattern("aggregate", "agregado", "combined", "conjunto"),
+        " [Dispositivo Agregado]",
+    ),
+    (
+        _keyword_pattern("múltipla", "multiple", "multi-output", "multi output"),
+        " [Multi-Output Virtual]",
+    ),
+    (
+        _keyword_pattern("obs", "audio hijack", "rogue amoeba", "studio", "interface"),
+        " [Software Audio]",
+    ),
+    (_keyword_pattern("macbook", "built-in"), " [Interno]"),
+    (_keyword_pattern("usb", "wireless", "bluetooth"), " [Externo]"),
+)
+
+
+class _TextPeer(tk.Text):
+    """Text que compartilha o conteúdo de outro Text via ``text peer`` (Tk 8.5+)."""
+
+    def __init__(self, master, source: tk.Text, **kw):
+        # O Tkinter não tem wrapper para peers: registrar o widget e criá-lo à mão
+        tk.BaseWidget._setup(self, master, {})
+        self.widgetName = "text"
+        source.tk.call(source._w, "peer", "create", self._w, *self._options(kw))
+
+
+class _Stats:
+    """Estatísticas da sessão exibidas na interface.
+
+    Escritas apenas pelo thread do Tk (produtores passam por _post_to_ui),
+    exceto current_audio_level, que é uma atribuição simples lida no redesenho.
+    """
+
+    __slots__ = (
+        "total_transcriptions",
+        "languages_detected",
+        "translation_count",
+        "current_audio_level",
+        "uptime_seconds",
+        "status",
+    )
+
+    def __init__(self):
+        self.total_transcriptions = 0
+        self.languages_detected = Counter()
+        self.translation_count = 0
+        self.current_audio_level = 0.0
+        self.uptime_seconds = 0
+        self.status = "stopped"
+
+
 class DesktopInterface:
     """Interface desktop usando Tkinter."""
 
+    # Limite de linhas mantidas na área de transcrições
+    MAX_LINES = 5000
+
+    # Estilos da barra de nível de áudio: (limite superior, estilo, cor)
+    _LEVEL_STYLES = (
+        (60, "green.Horizontal.TProgressbar", "green"),
+        (85, "orange.Horizontal.TProgressbar", "orange"),
+        (101, "red.Horizontal.TProgressbar", "red"),
+    )
+
+    # Máximo de callbacks de outros threads executados por despertar do Tk
+    _MAX_UI_CALLS_PER_DRAIN = 64
+
+    # Intervalo mínimo entre redesenhos da barra de áudio (~15 Hz)
+    _LEVEL_INTERVAL = 0.066
+
+    # Texto do indicador para cada estado de transcrição
+    _TRANSCRIPTION_STATE_LABELS = {
+        "idle": "😴 Parado",
+        "silent": "🔇 Sem som",
+        "listening": "👂 Ouvindo",
+        "transcribing": "🎙️ Transcrevendo",
+    }
+
+    # Cache do timestamp HH:MM:SS do segundo atual
+    _last_second: int = -1
+    _last_timestamp: str = ""
+
+    # Formato das entradas na área de transcrições
+    _ENTRY_TEMPLATE = "[{ts}] ({lang}) {text}\n"
+    _TRANS_TEMPLATE = "    → {tr}\n"
+
+    # Estado da aplicação: (texto, cor, estado do botão iniciar, do botão parar)
+    _STATE_STYLES = {
+        "running": ("Executando", "green", "disabled", "normal"),
+        "stopped": ("Parado", "red", "normal", "disabled"),
+        "error": ("Erro", "red", "normal", "disabled"),
+        "starting": ("Iniciando...", "orange", "disabled", "normal"),
+        "stopping": ("Parando...", "orange", "disabled", "disabled"),
+    }
+
     def __init__(self, config, transcription_manager=None, config_manager=None):
         self.config = config
         self.config_manager = config_manager  # Para salvar configurações
@@ -24,21 +142,38 @@ class DesktopInterface:
 
         # Estado da interface
         self.is_running = False
-        self.current_stats = {
-            "total_transcriptions": 0,
-            "languages_detected": {},
-            "translation_count": 0,
-            "current_audio_level": 0.0,
-            "uptime_seconds": 0,
-            "status": "stopped",
-        }
-        self.start_time = None
+        self.current_stats = _Stats()
+        self.start_time = None  # time.monotonic() do início da transcrição
+        self._last_uptime_sec = -1
+
+        # Transcrições pendentes, inseridas em lote no Text pelo thread do Tk
+        self._pending = deque()
+        self._flush_scheduled = False
+        self._last_transcription_text = None  # texto da entrada na marca last_entry
+
+        # Sequência para dar nomes únicos às marcas de cada exportação
+        self._export_seq = 0
+
+        # Resumo das configurações atuais (recalculado ao aplicar mudanças)
+        self._config_info_str = None
+        self._last_config_signature = None
+
+        # Últimos valores desenhados, para evitar chamadas Tcl redundantes
+        self._last_level_int = -1
+        self._last_level_render = 0.0
+        self._last_stats_key = None
+        self._last_status_style = None
+        self._last_start_state = None
+        self._last_stop_state = None
 
         # Estado de transcrição para ícones
         self.transcription_state = (
             "idle"  # 'idle', 'listening', 'transcribing', 'silent'
         )
 
+        # Janela sempre por cima
+        self._is_on_top = False
+
         # Configurações de fonte
         self.font_size = 10
         self.font_family = "Arial"
@@ -62,6 +197,10 @@ class DesktopInterface:
             "ko": "Coreano",
             "zh": "Chinês",
         }
+        self._language_values = list(self.available_languages.values())
+        self._lang_display_to_code = {
+            name: code for code, name in self.available_languages.items()
+        }
 
         # Criar janela principal
         self.root = tk.Tk()
@@ -72,19 +211,114 @@ class DesktopInterface:
         # Configurar fechamento da janela
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Serializa start/stop da aplicação, executados em threads daemon
+        self._lifecycle_lock = threading.Lock()
+
+        # Chamadas vindas de outros threads são executadas no thread do Tk
+        self._ui_calls = queue.SimpleQueue()
+        self.root.bind("<<UiCall>>", self._drain_ui_calls)
+        self._setup_wakeup_pipe()
+
+        # Nível de áudio é enviado pelo thread de captura apenas quando muda
+        self._level_event_pending = False
+
         self._load_available_devices()
         self._setup_ui()
 
-    def _load_available_devices(self):
-        """Carrega dispositivos de áudio disponíveis."""
+    def _post_to_ui(self, callback):
+        """Enfileira um callback para execução no thread do Tk."""
+        self._ui_calls.put(callback)
+        # Escrita e fechamento do pipe são serializados pelo mesmo lock
+        with self._pipe_lock:
+            if self._wakeup_w is not None:
+                try:
+                    os.write(self._wakeup_w, b".")
+                except BlockingIOError:
+                    # Pipe cheio: já existe um despertar pendente
+                    pass
+                return
+            if self._pipe_closed:
+                # Encerrando: não há mais loop do Tk para acordar
+                return
+        self._notify_ui("<<UiCall>>")
+
+    def _setup_wakeup_pipe(self):
+        """Cria o self-pipe que acorda o loop do Tk sem polling."""
+        self._wakeup_r = self._wakeup_w = None
+        self._pipe_lock = threading.Lock()
+        self._pipe_closed = False
+
+        # createfilehandler não existe no Tk do Windows; lá usamos eventos virtuais
+        if os.name == "nt" or not hasattr(self.root.tk, "createfilehandler"):
+            return
+
         try:
-            # Import absoluto para evitar problemas
-            import os
-            import sys
+            r, w = os.pipe()
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+            self.root.tk.createfilehandler(r, tk.READABLE, self._drain_wakeup)
+        except (OSError, tk.TclError) as e:
+            logger.debug(f"Self-pipe indisponível, usando eventos virtuais: {e}")
+            return
+
+        self._wakeup_r, self._wakeup_w = r, w
 
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    def _close_wakeup_pipe(self):
+        """Remove o handler e fecha o self-pipe."""
+        with self._pipe_lock:
+            r, w = self._wakeup_r, self._wakeup_w
+            if r is None:
+                return
+            self._wakeup_r = self._wakeup_w = None
+            self._pipe_closed = True
 
-            from src.audio.device_manager import AudioDeviceManager
+        # Nenhum escritor usa mais os descritores depois de liberado o lock
+        try:
+            self.root.tk.deletefilehandler(r)
+        except tk.TclError:
+            pass
+        os.close(r)
+        os.close(w)
+
+    def _drain_wakeup(self, fd, mask):
+        """Consome os bytes do self-pipe e executa os callbacks pendentes."""
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._drain_ui_calls()
+
+    def _notify_ui(self, sequence: str):
+        """Gera um evento virtual para ser tratado no thread do Tk."""
+        try:
+            self.root.event_generate(sequence, when="tail")
+        except (tk.TclError, RuntimeError):
+            # Janela já destruída ou loop principal encerrado
+            pass
+
+    def _drain_ui_calls(self, event=None):
+        """Executa os callbacks enfileirados por outros threads."""
+        # Limitar o trabalho por despertar para não travar o redesenho
+        for _ in range(self._MAX_UI_CALLS_PER_DRAIN):
+            try:
+                callback = self._ui_calls.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Erro ao executar atualização da UI: {e}")
+
+        # Ainda há itens: continuar depois que o Tk processar seus eventos
+        if not self._ui_calls.empty():
+            self.root.after_idle(self._drain_ui_calls)
+
+    def _load_available_devices(self):
+        """Carrega dispositivos de áudio disponíveis."""
+        try:
+            if AudioDeviceManager is None:
+                raise RuntimeError("sounddevice indisponível")
 
             device_manager = AudioDeviceManager()
             # get_input_devices() agora retorna dispositivos com entrada + virtuais
@@ -95,52 +329,12 @@ class DesktopInterface:
                 # Adicionar informação sobre tipo de dispositivo
                 device_info = f"{device_id}: {device_name}"
 
-                # Identificar tipos especiais
+                # Identificar tipos especiais (primeira categoria que casar)
                 name_lower = device_name.lower()
-                if any(
-                    keyword in name_lower
-                    for keyword in [
-                        "blackhole",
-                        "loopback",
-                        "soundflower",
-                        "vb-audio",
-                        "voicemeeter",
-                    ]
-                ):
-                    device_info += " [Virtual Audio]"
-                elif any(
-                    keyword in name_lower
-                    for keyword in ["aggregate", "agregado", "combined", "conjunto"]
-                ):
-                    device_info += " [Dispositivo Agregado]"
-                elif any(
-                    keyword in name_lower
-                    for keyword in [
-                        "múltipla",
-                        "multiple",
-                        "multi-output",
-                        "multi output",
-                    ]
-                ):
-                    device_info += " [Multi-Output Virtual]"
-                elif any(
-                    keyword in name_lower
-                    for keyword in [
-                        "obs",
-                        "audio hijack",
-                        "rogue amoeba",
-                        "studio",
-                        "interface",
-                    ]
-                ):
-                    device_info += " [Software Audio]"
-                elif "macbook" in name_lower or "built-in" in name_lower:
-                    device_info += " [Interno]"
-                elif any(
-                    keyword in name_lower
-                    for keyword in ["usb", "wireless", "bluetooth"]
-                ):
-                    device_info += " [Externo]"
+                for pattern, tag in _DEVICE_CATEGORIES:
+                    if pattern.search(name_lower):
+                        device_info += tag
+                        break
 
                 self.available_devices.append((device_id, device_info))
 
@@ -155,6 +349,13 @@ class DesktopInterface:
             # Fallback - criar lista com dispositivo padrão
             self.available_devices = [(None, "Dispositivo padrão do sistema")]
 
+        # Índices para consultas diretas no combobox e ao aplicar configurações
+        self._device_info_to_id = {}
+        self._device_id_to_index = {}
+        for idx, (device_id, device_info) in enumerate(self.available_devices):
+            self._device_info_to_id[device_info] = device_id
+            self._device_id_to_index.setdefault(device_id, idx)
+
     def _setup_ui(self):
         """Configura a interface do usuário."""
         # Notebook para abas
@@ -169,8 +370,30 @@ class DesktopInterface:
         config_tab = ttk.Frame(notebook)
         notebook.add(config_tab, text="  ⚙️ Configurações  ")
 
+        # Estilos da barra de áudio criados uma única vez
+        style = ttk.Style(self.root)
+        for _, style_name, color in self._LEVEL_STYLES:
+            style.configure(style_name, background=color)
+        self._current_bar_style = None
+
         self._setup_main_tab(main_tab)
-        self._setup_config_tab(config_tab)
+
+        # A aba de configurações só é construída quando aberta pela primeira vez
+        self._notebook = notebook
+        self._config_tab = config_tab
+        self._config_built = False
+        notebook.bind("<<NotebookTabChanged>>", self._maybe_build_config_tab)
+
+        # Um único cálculo de geometria depois de criar todos os widgets
+        self.root.update_idletasks()
+
+    def _maybe_build_config_tab(self, event=None):
+        """Constrói a aba de configurações na primeira vez que é selecionada."""
+        if self._config_built:
+            return
+        if self._notebook.index("current") == self._notebook.index(self._config_tab):
+            self._config_built = True
+            self._setup_config_tab(self._config_tab)
 
     def _setup_main_tab(self, parent):
         """Configura a aba principal."""
@@ -178,6 +401,9 @@ class DesktopInterface:
         main_frame = ttk.Frame(parent, padding="10")
         main_frame.pack(fill="both", expand=True)
 
+        # Suspender a propagação de geometria enquanto os filhos são criados
+        main_frame.grid_propagate(False)
+
         # Configurar redimensionamento
         main_frame.columnconfigure(1, weight=1)
         main_frame.rowconfigure(1, weight=1)
@@ -226,20 +452,17 @@ class DesktopInterface:
         self.stop_button.grid(row=0, column=1, padx=5)
 
         # Status
-        self.status_var = tk.StringVar(value="Parado")
         status_label = ttk.Label(controls_frame, text="Status:")
         status_label.grid(row=0, column=2, padx=(20, 5), sticky=tk.E)
 
-        self.status_display = ttk.Label(
-            controls_frame, textvariable=self.status_var, foreground="red"
-        )
+        self.status_display = ttk.Label(controls_frame, text="Parado", foreground="red")
         self.status_display.grid(row=0, column=3, sticky=tk.W)
 
         # Nível de áudio
         audio_label = ttk.Label(controls_frame, text="Áudio:")
         audio_label.grid(row=1, column=0, padx=(0, 5), pady=(10, 0), sticky=tk.W)
 
-        self.audio_level_var = tk.DoubleVar()
+        self.audio_level_var = tk.IntVar()
         self.audio_progressbar = ttk.Progressbar(
             controls_frame, variable=self.audio_level_var, maximum=100, length=200
         )
@@ -261,11 +484,21 @@ class DesktopInterface:
         transcriptions_frame.rowconfigure(0, weight=1)
 
         # Área de texto para transcrições
+        # Objeto de fonte único: mudar o tamanho não exige reinterpretar a fonte
+        self._text_font = tkfont.Font(
+            root=self.root, family=self.font_family, size=self.font_size
+        )
+
+        # Sem pilha de desfazer: o texto é só de leitura e recebe inserções em lote
         self.transcriptions_text = scrolledtext.ScrolledText(
             transcriptions_frame,
             wrap=tk.WORD,
             height=12,
-            font=(self.font_family, self.font_size),
+            font=self._text_font,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state="disabled",  # só leitura; liberado apenas durante escritas
         )
         self.transcriptions_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
@@ -282,16 +515,14 @@ class DesktopInterface:
         info_row1.columnconfigure(1, weight=1)
 
         # Estatísticas
-        self.stats_var = tk.StringVar(value="Total: 0 transcrições")
-        stats_label = ttk.Label(info_row1, textvariable=self.stats_var)
-        stats_label.grid(row=0, column=0, sticky=tk.W)
+        self.stats_label = ttk.Label(info_row1, text="Total: 0 transcrições")
+        self.stats_label.grid(row=0, column=0, sticky=tk.W)
 
         # Indicador de estado com ícone
-        self.state_var = tk.StringVar(value="😴 Parado")
-        state_label = ttk.Label(
-            info_row1, textvariable=self.state_var, font=("Arial", 10, "bold")
+        self.state_label = ttk.Label(
+            info_row1, text="😴 Parado", font=("Arial", 10, "bold")
         )
-        state_label.grid(row=0, column=1, padx=(20, 0))
+        self.state_label.grid(row=0, column=1, padx=(20, 0))
 
         # Segunda linha de informações
         info_row2 = ttk.Frame(info_frame)
@@ -331,6 +562,8 @@ class DesktopInterface:
         )
         teleprompter_button.grid(row=0, column=6, padx=(5, 0))
 
+        main_frame.grid_propagate(True)
+
         # Iniciar thread de atualização da UI
         self._start_ui_updater()
 
@@ -368,10 +601,9 @@ class DesktopInterface:
         # Definir valor atual
         current_device = getattr(self.config.audio, "device_id", None)
         if current_device is not None:
-            for idx, (device_id, device_info) in enumerate(self.available_devices):
-                if device_id == current_device:
-                    self.device_combo.current(idx)
-                    break
+            idx = self._device_id_to_index.get(current_device)
+            if idx is not None:
+                self.device_combo.current(idx)
         else:
             self.device_combo.current(0)
 
@@ -405,11 +637,10 @@ class DesktopInterface:
             row=row, column=0, sticky=tk.W, pady=5
         )
         self.language_var = tk.StringVar()
-        language_values = list(self.available_languages.values())
         self.language_combo = ttk.Combobox(
             config_frame,
             textvariable=self.language_var,
-            values=language_values,
+            values=self._language_values,
             state="readonly",
             width=20,
         )
@@ -419,7 +650,7 @@ class DesktopInterface:
         current_lang = getattr(self.config.transcription, "language", None) or "auto"
         lang_display = self.available_languages.get(current_lang, "Auto-detectar")
         try:
-            self.language_combo.current(language_values.index(lang_display))
+            self.language_combo.current(self._language_values.index(lang_display))
         except ValueError:
             self.language_combo.current(0)  # auto como padrão
 
@@ -536,11 +767,10 @@ class DesktopInterface:
             row=row, column=0, sticky=tk.W, pady=5
         )
         self.target_language_var = tk.StringVar()
-        target_language_values = list(self.available_languages.values())
         self.target_language_combo = ttk.Combobox(
             config_frame,
             textvariable=self.target_language_var,
-            values=target_language_values,
+            values=self._language_values,
             state="readonly",
             width=20,
         )
@@ -553,7 +783,7 @@ class DesktopInterface:
         target_display = self.available_languages.get(current_target, "Português")
         try:
             self.target_language_combo.current(
-                target_language_values.index(target_display)
+                self._language_values.index(target_display)
             )
         except ValueError:
             self.target_language_combo.current(1)  # português como padrão
@@ -593,7 +823,9 @@ class DesktopInterface:
     def _toggle_always_on_top(self):
         """Liga/desliga o modo sempre por cima."""
         is_on_top = self.always_on_top_var.get()
-        self.root.wm_attributes("-topmost", is_on_top)
+        if is_on_top != self._is_on_top:
+            self.root.wm_attributes("-topmost", is_on_top)
+            self._is_on_top = is_on_top
 
     def _increase_font(self):
         """Aumenta o tamanho da fonte."""
@@ -609,17 +841,13 @@ class DesktopInterface:
 
     def _update_font(self):
         """Atualiza a fonte da área de texto."""
-        self.transcriptions_text.config(font=(self.font_family, self.font_size))
+        self._text_font.configure(size=self.font_size)
         self.font_size_var.set(f"{self.font_size}pt")
 
     def export_transcriptions(self):
         """Exporta as transcrições para um arquivo."""
-        import os
-        from datetime import datetime
-        from tkinter import filedialog
-
-        content = self.transcriptions_text.get(1.0, tk.END).strip()
-        if not content:
+        # Procurar qualquer caractere visível sem copiar o texto inteiro
+        if not self.transcriptions_text.search(r"\S", "1.0", tk.END, regexp=True):
             messagebox.showwarning("Aviso", "Não há transcrições para exportar.")
             return
 
@@ -637,42 +865,127 @@ class DesktopInterface:
             )
 
             if filename:
-                # Preparar conteúdo com cabeçalho
-                header = f"Transcrições Whisper Transcriber\n"
-                header += (
-                    f"Exportado em: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}\n"
+                # O thread do Tk lê o texto em blocos e os repassa, por uma fila
+                # limitada, ao thread que grava: só alguns blocos ficam em memória
+                stats_snapshot = (
+                    self.current_stats.total_transcriptions,
+                    self.current_stats.translation_count,
                 )
-                header += f"Total de transcrições: {self.current_stats['total_transcriptions']}\n"
-                if self.current_stats["translation_count"] > 0:
-                    header += f"Total de traduções: {self.current_stats['translation_count']}\n"
-                header += "\n" + "=" * 60 + "\n\n"
+                chunks: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=4)
+                cancelled = threading.Event()
+                threading.Thread(
+                    target=self._do_export,
+                    args=(filename, chunks, cancelled, stats_snapshot),
+                    daemon=True,
+                ).start()
+
+                # Marcas acompanham inserções e remoções durante a exportação
+                self._export_seq += 1
+                pos_mark = f"export{self._export_seq}_pos"
+                end_mark = f"export{self._export_seq}_end"
+                self.transcriptions_text.mark_set(pos_mark, "1.0")
+                self.transcriptions_text.mark_set(end_mark, "end-1c")
+                self.transcriptions_text.mark_gravity(end_mark, tk.LEFT)
+                self._feed_export(chunks, cancelled, pos_mark, end_mark)
+
+        except Exception as e:
+            logger.error(f"Erro ao exportar transcrições: {e}")
+            messagebox.showerror("Erro", f"Erro ao exportar transcrições:\n{e}")
 
-                # Salvar arquivo
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(header + content)
+    def _feed_export(
+        self,
+        chunks: "queue.Queue[Optional[str]]",
+        cancelled: threading.Event,
+        pos_mark: str,
+        end_mark: str,
+        lines_per_chunk: int = 1000,
+    ):
+        """Envia o próximo bloco do texto ao thread de gravação, um passo por vez."""
+        text = self.transcriptions_text
+        if cancelled.is_set():
+            text.mark_unset(pos_mark, end_mark)
+            return
+        if chunks.full():
+            # Gravação mais lenta que a leitura: tentar de novo sem bloquear o Tk
+            self.root.after(
+                10, self._feed_export, chunks, cancelled, pos_mark, end_mark
+            )
+            return
 
-                messagebox.showinfo(
+        if text.compare(pos_mark, ">=", end_mark):
+            chunks.put_nowait(None)  # Fim do texto
+            text.mark_unset(pos_mark, end_mark)
+            return
+
+        stop = text.index(f"{pos_mark} + {lines_per_chunk} lines linestart")
+        if text.compare(stop, ">", end_mark):
+            stop = text.index(end_mark)
+        chunks.put_nowait(text.get(pos_mark, stop))
+        text.mark_set(pos_mark, stop)
+        self.root.after(1, self._feed_export, chunks, cancelled, pos_mark, end_mark)
+
+    def _do_export(
+        self,
+        filename: str,
+        chunks: "queue.Queue[Optional[str]]",
+        cancelled: threading.Event,
+        stats_snapshot: tuple,
+    ):
+        """Grava o arquivo de exportação fora do thread do Tk."""
+        total_transcriptions, translation_count = stats_snapshot
+        try:
+            # Preparar conteúdo com cabeçalho
+            lines = [
+                "Transcrições Whisper Transcriber\n",
+                f"Exportado em: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}\n",
+                f"Total de transcrições: {total_transcriptions}\n",
+            ]
+            if translation_count > 0:
+                lines.append(f"Total de traduções: {translation_count}\n")
+            lines.append("\n" + "=" * 60 + "\n\n")
+
+            # Salvar arquivo: cabeçalho e depois os blocos à medida que chegam
+            with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.writelines(lines)
+                while True:
+                    try:
+                        chunk = chunks.get(timeout=10)
+                    except queue.Empty:
+                        raise RuntimeError("leitura do texto interrompida")
+                    if chunk is None:
+                        break
+                    f.write(chunk)
+
+            self._post_to_ui(
+                lambda: messagebox.showinfo(
                     "Sucesso", f"Transcrições exportadas para:\n{filename}"
                 )
+            )
 
         except Exception as e:
+            cancelled.set()
             logger.error(f"Erro ao exportar transcrições: {e}")
-            messagebox.showerror("Erro", f"Erro ao exportar transcrições:\n{e}")
+            error_msg = str(e)
+            self._post_to_ui(
+                lambda: messagebox.showerror(
+                    "Erro", f"Erro ao exportar transcrições:\n{error_msg}"
+                )
+            )
 
     def _update_transcription_state(self, audio_level: float = 0.0):
         """Atualiza o estado da transcrição baseado no nível de áudio."""
         if not self.is_running:
-            self.transcription_state = "idle"
-            self.state_var.set("😴 Parado")
+            state = "idle"
         elif audio_level < 1:  # Muito baixo (ajustado de 5 para 1)
-            self.transcription_state = "silent"
-            self.state_var.set("🔇 Sem som")
+            state = "silent"
         elif audio_level < 15:  # Nível baixo (ajustado de 30 para 15)
-            self.transcription_state = "listening"
-            self.state_var.set("👂 Ouvindo")
+            state = "listening"
         else:  # Nível detectável, provavelmente transcrevendo
-            self.transcription_state = "transcribing"
-            self.state_var.set("🎙️ Transcrevendo")
+            state = "transcribing"
+
+        if state != self.transcription_state:
+            self.transcription_state = state
+            self.state_label.config(text=self._TRANSCRIPTION_STATE_LABELS[state])
 
     def open_teleprompter(self):
         """Abre a janela do teleprompter."""
@@ -682,11 +995,11 @@ class DesktopInterface:
             self.teleprompter_window.focus()
             return
 
-        # Ocultar GUI principal
-        self.root.withdraw()
-
-        # Criar nova janela de teleprompter
+        # Criar a janela do teleprompter antes de ocultar a GUI principal,
+        # para o gerenciador de janelas recompor a tela uma única vez
         self.teleprompter_window = TeleprompterWindow(self)
+        self.teleprompter_window.root.update_idletasks()
+        self.root.withdraw()
 
     def close_teleprompter(self):
         """Fecha a janela do teleprompter."""
@@ -697,8 +1010,18 @@ class DesktopInterface:
 
         # Mostrar GUI principal novamente
         self.root.deiconify()
+        self.root.after_idle(self._raise_root)
+
+    def _raise_root(self):
+        """Traz a janela principal para frente após ser reexibida."""
         self.root.lift()
-        self.root.focus()
+        self.root.focus_force()
+
+    def _on_teleprompter_destroyed(self, window):
+        """Limpa as referências quando a janela do teleprompter deixa de existir."""
+        if self.teleprompter_window is window:
+            self.teleprompter_window = None
+            self.teleprompter_text_widget = None
 
     def toggle_gui_visibility(self):
         """Alterna visibilidade da GUI principal."""
@@ -709,64 +1032,66 @@ class DesktopInterface:
             else:
                 self.root.withdraw()
 
-    def update_teleprompter(self, text: str, translation: Optional[str] = None):
-        """Atualiza o texto do teleprompter com timestamp e tradução."""
-        if self.teleprompter_text_widget:
+    def _views_at_bottom(self) -> Tuple[bool, bool]:
+        """Indica se a área principal e o teleprompter estão rolados até o fim."""
+        follow_main = self.transcriptions_text.yview()[1] >= 0.999
+        follow_teleprompter = False
+        if self.teleprompter_text_widget is not None:
             try:
-                from datetime import datetime
-
-                timestamp = datetime.now().strftime("%H:%M:%S")
-
-                # Formatar texto com timestamp
-                teleprompter_entry = f"[{timestamp}] {text}"
-                if translation and translation.strip():
-                    teleprompter_entry += f"\n    → {translation}"
-                teleprompter_entry += "\n\n"
-
-                self.teleprompter_text_widget.insert(tk.END, teleprompter_entry)
-                self.teleprompter_text_widget.see(tk.END)
+                follow_teleprompter = self.teleprompter_text_widget.yview()[1] >= 0.999
             except tk.TclError:
-                # Janela foi fechada
-                self.teleprompter_window = None
-                self.teleprompter_text_widget = None
+                pass
+        return follow_main, follow_teleprompter
+
+    def _scroll_teleprompter(self):
+        """Acompanha o fim do texto no teleprompter, se estiver aberto."""
+        # A referência é limpa no <Destroy> da janela, então basta checá-la
+        if self.teleprompter_text_widget is None:
+            return
+        try:
+            self.teleprompter_text_widget.see(tk.END)
+        except tk.TclError:
+            # Janela foi fechada
+            self.teleprompter_window = None
+            self.teleprompter_text_widget = None
 
     def _toggle_translation(self):
         """Habilita/desabilita controles de tradução."""
         enabled = self.translation_enabled_var.get()
-        state = "readonly" if enabled else "disabled"
-        self.target_language_combo.config(state=state)
+        self._set_combo_state(self.target_language_combo, enabled)
 
     def _toggle_vad(self):
         """Habilita/desabilita controles de VAD."""
         enabled = self.vad_enabled_var.get()
-        state = "readonly" if enabled else "disabled"
-        self.vad_aggressiveness_combo.config(state=state)
+        self._set_combo_state(self.vad_aggressiveness_combo, enabled)
+
+    @staticmethod
+    def _set_combo_state(combo: ttk.Combobox, enabled: bool):
+        """Reconfigura o combobox apenas se o estado realmente mudar."""
+        desired = "readonly" if enabled else "disabled"
+        if str(combo.cget("state")) != desired:
+            combo.config(state=desired)
 
     def _apply_configuration(self):
         """Aplica as configurações selecionadas."""
         try:
             # Dispositivo de áudio
-            device_text = self.device_var.get()
-            for device_id, device_info in self.available_devices:
-                if device_info == device_text:
-                    self.config.audio.device_id = device_id
-                    # Também define o device_name para debug
-                    device_name = device_info.split(": ", 1)[1] if ": " in device_info else device_info
-                    self.config.audio.device_name = device_name
-                    break
+            device_info = self.device_var.get()
+            if device_info in self._device_info_to_id:
+                self.config.audio.device_id = self._device_info_to_id[device_info]
+                # Também define o device_name para debug
+                device_name = device_info.split(": ", 1)[1] if ": " in device_info else device_info
+                self.config.audio.device_name = device_name
 
             # Modelo
             self.config.transcription.model_name = self.model_var.get()
 
             # Idioma
-            lang_display = self.language_var.get()
-            for lang_code, lang_name in self.available_languages.items():
-                if lang_name == lang_display:
-                    if lang_code == "auto":
-                        self.config.transcription.language = None
-                    else:
-                        self.config.transcription.language = lang_code
-                    break
+            lang_code = self._lang_display_to_code.get(self.language_var.get())
+            if lang_code is not None:
+                self.config.transcription.language = (
+                    None if lang_code == "auto" else lang_code
+                )
 
             # VAD (Voice Activity Detection)
             self.config.transcription.use_vad = self.vad_enabled_var.get()
@@ -780,11 +1105,11 @@ class DesktopInterface:
             self.config.translation.enabled = self.translation_enabled_var.get()
 
             if self.config.translation.enabled:
-                target_display = self.target_language_var.get()
-                for lang_code, lang_name in self.available_languages.items():
-                    if lang_name == target_display:
-                        self.config.translation.target_language = lang_code
-                        break
+                target_code = self._lang_display_to_code.get(
+                    self.target_language_var.get()
+                )
+                if target_code is not None:
+                    self.config.translation.target_language = target_code
 
             # Atualizar display
             self._update_current_config_display()
@@ -807,127 +1132,223 @@ class DesktopInterface:
             logger.error(f"Erro ao aplicar configurações: {e}")
             messagebox.showerror("Erro", f"Erro ao aplicar configurações:\n{e}")
 
-    def _update_current_config_display(self):
-        """Atualiza o display das configurações atuais."""
-        try:
-            model = getattr(self.config.transcription, "model_name", "unknown")
-            device = getattr(self.config.audio, "device_id", "auto")
-            lang = getattr(self.config.transcription, "language", None) or "auto"
-            translate = getattr(self.config.translation, "enabled", False)
-            target_lang = getattr(self.config.translation, "target_language", "pt")
-            use_vad = getattr(self.config.transcription, "use_vad", False)
-            vad_aggr = getattr(self.config.transcription, "vad_aggressiveness", 2)
+    def _config_signature(self) -> tuple:
+        """Retorna os campos de configuração exibidos no resumo."""
+        return (
+            getattr(self.config.transcription, "model_name", "unknown"),
+            getattr(self.config.audio, "device_id", "auto"),
+            getattr(self.config.transcription, "language", None) or "auto",
+            getattr(self.config.translation, "enabled", False),
+            getattr(self.config.translation, "target_language", "pt"),
+            getattr(self.config.transcription, "use_vad", False),
+            getattr(self.config.transcription, "vad_aggressiveness", 2),
+        )
+
+    def _get_config_info(self) -> str:
+        """Retorna o resumo das configurações atuais, calculado uma única vez."""
+        if self._config_info_str is None:
+            (
+                model,
+                device,
+                lang,
+                translate,
+                target_lang,
+                use_vad,
+                vad_aggr,
+            ) = self._config_signature()
 
             lang_display = self.available_languages.get(lang, lang)
             target_display = self.available_languages.get(target_lang, target_lang)
 
-            config_text = (
-                f"Atual: Modelo={model} | Dispositivo={device} | Idioma={lang_display}"
-            )
+            parts = [
+                f"Atual: Modelo={model}",
+                f"Dispositivo={device}",
+                f"Idioma={lang_display}",
+                f"VAD=Ativo({vad_aggr})" if use_vad else "VAD=Desabilitado",
+                (
+                    f"Tradução→{target_display}"
+                    if translate
+                    else "Tradução=Desabilitada"
+                ),
+            ]
 
-            if use_vad:
-                config_text += f" | VAD=Ativo({vad_aggr})"
-            else:
-                config_text += " | VAD=Desabilitado"
+            self._config_info_str = " | ".join(parts)
 
-            if translate:
-                config_text += f" | Tradução→{target_display}"
-            else:
-                config_text += " | Tradução=Desabilitada"
+        return self._config_info_str
+
+    def _update_current_config_display(self):
+        """Atualiza o display das configurações atuais, se algo mudou."""
+        try:
+            signature = self._config_signature()
+            if signature == self._last_config_signature:
+                return
+            self._last_config_signature = signature
 
-            self.current_config_var.set(config_text)
+            self._config_info_str = None
+            self.current_config_var.set(self._get_config_info())
 
         except Exception as e:
             logger.error(f"Erro ao atualizar display de configuração: {e}")
+            self._last_config_signature = None
             self.current_config_var.set("Erro ao carregar configurações")
 
     def _start_ui_updater(self):
-        """Inicia thread para atualizar UI periodicamente."""
+        """Inicia o relógio de tempo de execução no loop principal do Tk."""
+        self._after_id = None
+        self._tick()
 
-        def update_loop():
-            while True:
-                try:
-                    # Atualizar a cada 100ms
-                    self.root.after(100, self._update_ui_elements)
-                    time.sleep(0.1)
-                except Exception as e:
-                    logger.error(f"Erro no loop de atualização da UI: {e}")
-
-        update_thread = threading.Thread(target=update_loop, daemon=True)
-        update_thread.start()
+    def _tick(self):
+        """Executa uma atualização periódica e se reagenda."""
+        try:
+            self._update_ui_elements()
+        finally:
+            self._after_id = self.root.after(1000, self._tick)
 
     def _update_ui_elements(self):
-        """Atualiza elementos da UI no thread principal."""
+        """Atualiza o tempo de execução."""
         try:
-            # Atualizar estatísticas
-            stats_text = (
-                f"Total: {self.current_stats['total_transcriptions']} transcrições"
-            )
-            if self.current_stats["translation_count"] > 0:
-                stats_text += f" | Traduções: {self.current_stats['translation_count']}"
-            if self.current_stats["uptime_seconds"] > 0:
-                mins = self.current_stats["uptime_seconds"] // 60
-                secs = self.current_stats["uptime_seconds"] % 60
-                stats_text += f" | Tempo: {mins:02d}:{secs:02d}"
-
-            self.stats_var.set(stats_text)
-
-            # Atualizar nível de áudio
-            level = self.current_stats["current_audio_level"]
-            self.audio_level_var.set(level)
-            self.audio_level_label.config(text=f"{level:.0f}%")
-
-            # Atualizar tempo de execução
-            if self.is_running and self.start_time:
-                self.current_stats["uptime_seconds"] = int(
-                    (datetime.now() - self.start_time).total_seconds()
-                )
+            # current_stats tem um único escritor: o thread principal (Tk)
+            if threading.current_thread() is not threading.main_thread():
+                logger.error("_update_ui_elements chamado fora do thread do Tk")
+                return
+
+            if self.is_running and self.start_time is not None:
+                uptime = int(time.monotonic() - self.start_time)
+                if uptime != self._last_uptime_sec:
+                    self._last_uptime_sec = uptime
+                    self.current_stats.uptime_seconds = uptime
+                    self._refresh_stats()
 
         except Exception as e:
             logger.error(f"Erro ao atualizar UI: {e}")
 
+    def _refresh_stats(self):
+        """Redesenha as estatísticas se algum contador mudou."""
+        total = self.current_stats.total_transcriptions
+        translations = self.current_stats.translation_count
+        uptime = self.current_stats.uptime_seconds
+
+        stats_key = (total, translations, uptime)
+        if stats_key == self._last_stats_key:
+            return
+        self._last_stats_key = stats_key
+
+        parts = [f"Total: {total} transcrições"]
+        if translations > 0:
+            parts.append(f"Traduções: {translations}")
+        if uptime > 0:
+            mins, secs = divmod(uptime, 60)
+            parts.append(f"Tempo: {mins:02d}:{secs:02d}")
+
+        self.stats_label.config(text=" | ".join(parts))
+
+    def _refresh_audio_level(self, event=None, force: bool = False):
+        """Redesenha o nível de áudio e o indicador de estado."""
+        now = time.monotonic()
+        wait = self._LEVEL_INTERVAL - (now - self._last_level_render)
+        if wait > 0 and not force:
+            # Evento continua pendente; redesenhar ao fim do intervalo
+            self.root.after(int(wait * 1000) + 1, self._refresh_audio_level)
+            return
+
+        self._level_event_pending = False
+        self._last_level_render = now
+
+        # Atualizar nível de áudio apenas quando o percentual inteiro mudar
+        level = self.current_stats.current_audio_level
+        level_int = int(level)
+        if level_int != self._last_level_int:
+            self.audio_level_var.set(level_int)
+            self.audio_level_label.config(text=f"{level_int}%")
+            self._last_level_int = level_int
+
+            # Trocar o estilo só quando o nível muda de faixa
+            for limit, style_name, _ in self._LEVEL_STYLES:
+                if level_int < limit:
+                    break
+            if style_name != self._current_bar_style:
+                self.audio_progressbar.configure(style=style_name)
+                self._current_bar_style = style_name
+
+        self._update_transcription_state(level)
+
     def start_transcription(self):
         """Inicia a transcrição."""
         if self.is_running or not self.app:
             return
 
         try:
-            self.start_button.config(state="disabled")
-            self.stop_button.config(state="normal")
-            self.status_var.set("Iniciando...")
-            self.status_display.config(foreground="orange")
+            self._apply_state("starting")
 
-            # Iniciar aplicação em thread separada
-            def start_app():
-                try:
-                    self.app.start()
-                    self.root.after(0, lambda: self._on_app_started())
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.error(f"Erro ao iniciar aplicação: {error_msg}")
-                    self.root.after(0, lambda: self._on_app_error(error_msg))
-
-            app_thread = threading.Thread(target=start_app, daemon=True)
-            app_thread.start()
+            # Iniciar aplicação no worker
+            future = self._run_lifecycle(self.app.start)
+            future.add_done_callback(self._on_start_done)
 
         except Exception as e:
             logger.error(f"Erro ao iniciar transcrição: {e}")
             self._on_app_error(str(e))
 
+    def _run_lifecycle(self, func) -> Future:
+        """Executa start/stop da app num thread daemon, um de cada vez.
+
+        Threads daemon não seguram o processo se a janela for fechada durante
+        o carregamento do modelo ou com um stop travado.
+        """
+        future: Future = Future()
+
+        def run():
+            with self._lifecycle_lock:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(func())
+                except BaseException as e:
+                    future.set_exception(e)
+
+        threading.Thread(target=run, name="whisper-lifecycle", daemon=True).start()
+        return future
+
+    def _on_start_done(self, future: Future):
+        """Repassa o resultado de app.start() para o thread do Tk."""
+        error = future.exception()
+        if error is None:
+            self._post_to_ui(self._on_app_started)
+        else:
+            error_msg = str(error)
+            logger.error(f"Erro ao iniciar aplicação: {error_msg}")
+            self._post_to_ui(lambda: self._on_app_error(error_msg))
+
+    def _on_stop_done(self, future: Future):
+        """Repassa o término de app.stop() para o thread do Tk."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Erro ao parar aplicação: {error}")
+        self._post_to_ui(self._on_app_stopped)
+
+    def _apply_state(self, name: str):
+        """Aplica de uma vez o texto, a cor e os botões de um estado."""
+        text, color, start_state, stop_state = self._STATE_STYLES[name]
+        if (text, color) != self._last_status_style:
+            self.status_display.config(text=text, foreground=color)
+            self._last_status_style = (text, color)
+        if start_state != self._last_start_state:
+            self.start_button.config(state=start_state)
+            self._last_start_state = start_state
+        if stop_state != self._last_stop_state:
+            self.stop_button.config(state=stop_state)
+            self._last_stop_state = stop_state
+        self.current_stats.status = name
+
     def _on_app_started(self):
         """Callback quando app inicia com sucesso."""
         self.is_running = True
-        self.start_time = datetime.now()
-        self.status_var.set("Executando")
-        self.status_display.config(foreground="green")
-        self.current_stats["status"] = "running"
+        self.start_time = time.monotonic()
+        self._apply_state("running")
+        self._refresh_audio_level(force=True)
 
     def _on_app_error(self, error_msg: str):
         """Callback quando há erro na app."""
-        self.start_button.config(state="normal")
-        self.stop_button.config(state="disabled")
-        self.status_var.set("Erro")
-        self.status_display.config(foreground="red")
+        self._apply_state("error")
         messagebox.showerror("Erro", f"Erro ao iniciar transcrição:\n{error_msg}")
 
     def stop_transcription(self):
@@ -936,21 +1357,11 @@ class DesktopInterface:
             return
 
         try:
-            self.stop_button.config(state="disabled")
-            self.status_var.set("Parando...")
-            self.status_display.config(foreground="orange")
-
-            # Parar aplicação em thread separada
-            def stop_app():
-                try:
-                    self.app.stop()
-                    self.root.after(0, lambda: self._on_app_stopped())
-                except Exception as e:
-                    logger.error(f"Erro ao parar aplicação: {e}")
-                    self.root.after(0, lambda: self._on_app_stopped())
+            self._apply_state("stopping")
 
-            stop_thread = threading.Thread(target=stop_app, daemon=True)
-            stop_thread.start()
+            # Parar aplicação no worker
+            future = self._run_lifecycle(self.app.stop)
+            future.add_done_callback(self._on_stop_done)
 
         except Exception as e:
             logger.error(f"Erro ao parar transcrição: {e}")
@@ -960,20 +1371,19 @@ class DesktopInterface:
         """Callback quando app para."""
         self.is_running = False
         self.start_time = None
-        self.start_button.config(state="normal")
-        self.stop_button.config(state="disabled")
-        self.status_var.set("Parado")
-        self.status_display.config(foreground="red")
-        self.current_stats["status"] = "stopped"
-        self.current_stats["current_audio_level"] = 0.0
-        self.audio_level_var.set(0)
+        self._apply_state("stopped")
+        self.current_stats.current_audio_level = 0.0
+        self._refresh_audio_level(force=True)
 
     def clear_transcriptions(self):
         """Limpa área de transcrições."""
-        self.transcriptions_text.delete(1.0, tk.END)
-        self.current_stats["total_transcriptions"] = 0
-        self.current_stats["languages_detected"] = {}
-        self.current_stats["translation_count"] = 0
+        with self._editing_transcriptions():
+            self.transcriptions_text.delete(1.0, tk.END)
+        self._last_transcription_text = None
+        self.current_stats.total_transcriptions = 0
+        self.current_stats.languages_detected = Counter()
+        self.current_stats.translation_count = 0
+        self._refresh_stats()
 
     def add_transcription(
         self,
@@ -984,89 +1394,141 @@ class DesktopInterface:
         audio_level: float = 0.0,
     ):
         """Adiciona nova transcrição à interface."""
+        # Formatar entrada no thread chamador, fora do loop do Tk
+        timestamp = self._format_timestamp()
+        parts = [self._ENTRY_TEMPLATE.format(ts=timestamp, lang=language, text=text)]
+        if translation:
+            parts.append(self._TRANS_TEMPLATE.format(tr=translation))
+        parts.append("\n")
+        entry = "".join(parts)
+        self._pending.append((entry, language, text, translation))
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._post_to_ui(lambda: self.root.after(50, self._flush_transcriptions))
+
+    def _format_timestamp(self) -> str:
+        """Retorna HH:MM:SS atual, reformatando só quando o segundo muda."""
+        now = time.time()
+        second = int(now)
+        if second != self._last_second:
+            self._last_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_second = second
+        return self._last_timestamp
+
+    def _flush_transcriptions(self):
+        """Insere de uma vez todas as transcrições pendentes."""
+        self._flush_scheduled = False
+
+        # Drenar só o que já estava na fila, para não ficar preso num fluxo
+        # contínuo de produtores; o restante entra no próximo lote
+        batch = [self._pending.popleft() for _ in range(len(self._pending))]
+        if not batch:
+            return
 
-        def update_ui():
-            timestamp = datetime.now().strftime("%H:%M:%S")
+        chunks = [entry for entry, *_ in batch]
+        translations = sum(1 for *_, translation in batch if translation)
+        self.current_stats.languages_detected.update(item[1] for item in batch)
 
-            # Formatar entrada
-            entry = f"[{timestamp}] ({language}) {text}"
-            if translation:
-                entry += f"\n    → {translation}"
-            entry += "\n\n"
+        # Só rolar até o fim quem já estava no fim (usuário pode estar lendo)
+        follow_main, follow_teleprompter = self._views_at_bottom()
 
-            # Adicionar ao texto principal
-            self.transcriptions_text.insert(tk.END, entry)
+        # Adicionar ao texto principal, marcando o início da última entrada
+        with self._editing_transcriptions():
+            self.transcriptions_text.insert(tk.END, "".join(chunks))
+            self._trim_transcriptions()
+        self.transcriptions_text.mark_set("last_entry", f"end-1c -{len(chunks[-1])}c")
+        self._last_transcription_text = batch[-1][2]
+        if follow_main:
             self.transcriptions_text.see(tk.END)  # Auto-scroll
-
-            # Adicionar ao teleprompter com timestamp e tradução
-            self.update_teleprompter(text, translation)
-
-            # Atualizar estatísticas
-            self.current_stats["total_transcriptions"] += 1
-
-            if language in self.current_stats["languages_detected"]:
-                self.current_stats["languages_detected"][language] += 1
-            else:
-                self.current_stats["languages_detected"][language] = 1
-
-            if translation:
-                self.current_stats["translation_count"] += 1
-
-        self.root.after(0, update_ui)
+        if follow_teleprompter:
+            self._scroll_teleprompter()  # o peer já exibe o texto inserido
+        self.transcriptions_text.update_idletasks()
+
+        # Atualizar estatísticas
+        self.current_stats.total_transcriptions += len(chunks)
+        self.current_stats.translation_count += translations
+        self._refresh_stats()
+
+    @contextmanager
+    def _editing_transcriptions(self):
+        """Libera a área de transcrições para escrita durante o bloco."""
+        self.transcriptions_text.config(state="normal")
+        try:
+            yield
+        finally:
+            self.transcriptions_text.config(state="disabled")
+
+    def _trim_transcriptions(self):
+        """Descarta as linhas mais antigas acima de MAX_LINES."""
+        self._trim_text(self.transcriptions_text, self.MAX_LINES)
+
+    @staticmethod
+    def _trim_text(widget: tk.Text, max_lines: int):
+        """Remove de uma só vez as linhas mais antigas acima de max_lines."""
+        line_count = int(widget.index("end-1c").split(".")[0])
+        if line_count > max_lines:
+            widget.delete("1.0", f"{line_count - max_lines + 1}.0")
+
+    def _last_entry_intact(self) -> bool:
+        """Verifica se a marca last_entry ainda aponta para a última entrada.
+
+        A entrada pode ter sido descartada pelo limite de linhas ou pela
+        limpeza; nesse caso a marca cai em outra linha e a tradução não deve
+        ser inserida ali.
+        """
+        if self._last_transcription_text is None:
+            return False
+        line = self.transcriptions_text.get("last_entry", "last_entry lineend")
+        return line.endswith(self._last_transcription_text.split("\n", 1)[0])
 
     def update_last_translation(self, translation: str):
         """Atualiza tradução da última entrada."""
 
         def update_ui():
-            # Buscar última linha com transcrição
-            content = self.transcriptions_text.get(1.0, tk.END)
-            lines = content.split("\n")
-
-            # Encontrar última entrada e adicionar tradução
-            last_text = None
-            for i in range(len(lines) - 1, -1, -1):
-                if lines[i].startswith("[") and "]" in lines[i]:
-                    # Extrair texto da transcrição para o teleprompter
-                    line = lines[i]
-                    if ") " in line:
-                        last_text = line.split(") ", 1)[1]
-
-                    # Inserir tradução na interface principal
-                    insert_pos = f"{i+2}.0"
+            # Garantir que a última entrada já está no widget
+            self._flush_transcriptions()
+
+            if self._last_entry_intact():
+                follow_main, follow_teleprompter = self._views_at_bottom()
+
+                # Inserir tradução logo abaixo da linha da última entrada
+                with self._editing_transcriptions():
                     self.transcriptions_text.insert(
-                        insert_pos, f"    → {translation}\n"
+                        "last_entry +1 line linestart",
+                        self._TRANS_TEMPLATE.format(tr=translation),
                     )
+                if follow_main:
                     self.transcriptions_text.see(tk.END)
-                    break
+                if follow_teleprompter:
+                    self._scroll_teleprompter()
 
-            # Atualizar teleprompter com tradução
-            if last_text and self.teleprompter_text_widget:
-                try:
-                    from datetime import datetime
-
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-
-                    # Adicionar apenas a tradução ao teleprompter
-                    teleprompter_entry = f"    → {translation}\n\n"
-                    self.teleprompter_text_widget.insert(tk.END, teleprompter_entry)
-                    self.teleprompter_text_widget.see(tk.END)
-                except tk.TclError:
-                    # Janela foi fechada
-                    self.teleprompter_window = None
-                    self.teleprompter_text_widget = None
+            self.current_stats.translation_count += 1
+            self._refresh_stats()
 
-            self.current_stats["translation_count"] += 1
-
-        self.root.after(0, update_ui)
+        self._post_to_ui(update_ui)
 
     def update_audio_level(self, level: float):
         """Atualiza nível de áudio."""
-        self.current_stats["current_audio_level"] = level
-        self._update_transcription_state(level)
+        self.current_stats.current_audio_level = level
+
+        # Mesmo percentual inteiro já desenhado: nada muda na tela (os limites
+        # de estado também são inteiros), então não acordar o loop do Tk
+        if int(level) == self._last_level_int:
+            return
+
+        # Um único evento pendente por vez; o handler lê o valor mais recente
+        if not self._level_event_pending:
+            self._level_event_pending = True
+            self._post_to_ui(self._refresh_audio_level)
 
     def update_status(self, status: str):
         """Atualiza status da aplicação."""
-        self.current_stats["status"] = status
+
+        def apply_status():
+            self.current_stats.status = status
+
+        self._post_to_ui(apply_status)
 
     def set_app(self, app):
         """Define a aplicação Whisper."""
@@ -1086,6 +1548,12 @@ class DesktopInterface:
             self.stop_transcription()
         self.root.quit()
 
+    def _cancel_ui_updater(self):
+        """Cancela o callback periódico pendente antes de destruir a janela."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
     def on_closing(self):
         """Callback para fechamento da janela."""
         if self.is_running:
@@ -1093,9 +1561,16 @@ class DesktopInterface:
                 "Sair", "Transcrição está ativa. Deseja parar e sair?"
             ):
                 self.stop_transcription()
-                self.root.after(1000, self.root.destroy)  # Aguarda 1s para parar
+                self._cancel_ui_updater()
+                self.root.after(1000, self._destroy_root)  # Aguarda 1s para parar
         else:
-            self.root.destroy()
+            self._cancel_ui_updater()
+            self._destroy_root()
+
+    def _destroy_root(self):
+        """Libera o self-pipe e destrói a janela principal."""
+        self._close_wakeup_pipe()
+        self.root.destroy()
 
 
 class TeleprompterWindow:
@@ -1114,6 +1589,17 @@ class TeleprompterWindow:
         self.border_color = "#FFFFFF"
         self.current_bg = self.bg_color  # Cor atual do fundo
 
+        # Widgets criados em _create_window/_setup_ui
+        self.main_container = self.main_frame = self.controls_frame = None
+        self.config_frame = self.text_frame = self.text_widget = None
+
+        # Callbacks pendentes de fonte/transparência (debounce de 50 ms)
+        self._pending_font_after_id = None
+        self._pending_transparency_after_id = None
+
+        # Widgets que seguem o tema: (widget, também recebe cor do texto)
+        self._themed_widgets = []
+
         self._create_window()
         self._setup_ui()
 
@@ -1145,11 +1631,12 @@ class TeleprompterWindow:
 
         # Configurar fechamento
         self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.root.bind("<Destroy>", self._on_destroy)
 
     def _setup_transparent_background(self):
         """Configura o fundo com transparência controlada."""
         # Container principal - sem transparência para manter controles visíveis
-        self.main_container = tk.Frame(self.root, bg=self.bg_color)
+        self.main_container = self._themed(tk.Frame(self.root, bg=self.bg_color))
         self.main_container.pack(fill="both", expand=True, padx=5, pady=5)
 
         # Configurar cor inicial
@@ -1157,6 +1644,7 @@ class TeleprompterWindow:
 
     def _update_transparency(self):
         """Atualiza a transparência da janela de forma controlada."""
+        self._pending_transparency_after_id = None
         try:
             # Aplicar transparência à janela, mas manter um mínimo para visibilidade dos controles
             alpha_value = max(
@@ -1178,48 +1666,53 @@ class TeleprompterWindow:
             # Atualizar componentes
             self._update_background_colors()
 
-        except Exception as e:
-            print(f"Erro ao aplicar transparência: {e}")
+        except tk.TclError as e:
+            logger.warning(f"Erro ao aplicar transparência: {e}")
             # Fallback
             self.current_bg = self.bg_color
             self._update_background_colors()
 
     def _update_background_colors(self):
         """Atualiza cores de fundo dos componentes."""
-        if hasattr(self, "main_container"):
+        if self.main_container is not None:
             self.main_container.configure(bg=self.current_bg)
-        if hasattr(self, "text_widget"):
+        if self.text_widget is not None:
             self.text_widget.configure(bg=self.current_bg, fg=self.text_color)
 
     def _setup_ui(self):
         """Configura a interface do teleprompter."""
         # Frame principal de conteúdo
-        main_frame = tk.Frame(
-            self.main_container,
-            bg=self.current_bg,
-            highlightbackground=self.border_color,
-            highlightthickness=self.border_width,
+        main_frame = self._themed(
+            tk.Frame(
+                self.main_container,
+                bg=self.current_bg,
+                highlightbackground=self.border_color,
+                highlightthickness=self.border_width,
+            )
         )
         main_frame.pack(fill="both", expand=True, padx=5, pady=5)
         self.main_frame = main_frame  # Guardar referência
 
         # Frame de controles (no topo)
-        controls_frame = tk.Frame(main_frame, bg=self.current_bg)
+        controls_frame = self._themed(tk.Frame(main_frame, bg=self.current_bg))
         controls_frame.pack(fill="x", padx=5, pady=5)
         self.controls_frame = controls_frame  # Guardar referência
 
         # Título
-        title_label = tk.Label(
-            controls_frame,
-            text="📺 Teleprompter",
-            font=(self.font_family, 14, "bold"),
-            bg=self.current_bg,
-            fg=self.text_color,
+        title_label = self._themed(
+            tk.Label(
+                controls_frame,
+                text="📺 Teleprompter",
+                font=(self.font_family, 14, "bold"),
+                bg=self.current_bg,
+                fg=self.text_color,
+            ),
+            with_fg=True,
         )
         title_label.pack(side="left")
 
         # Controles de configuração
-        config_frame = tk.Frame(controls_frame, bg=self.current_bg)
+        config_frame = self._themed(tk.Frame(controls_frame, bg=self.current_bg))
         config_frame.pack(side="right")
         self.config_frame = config_frame  # Guardar referência
 
@@ -1236,8 +1729,11 @@ class TeleprompterWindow:
         transparency_btn.pack(side="left", padx=2)
 
         # Tamanho da fonte
-        tk.Label(
-            config_frame, text="Fonte:", bg=self.current_bg, fg=self.text_color
+        self._themed(
+            tk.Label(
+                config_frame, text="Fonte:", bg=self.current_bg, fg=self.text_color
+            ),
+            with_fg=True,
         ).pack(side="left")
 
         font_down_btn = tk.Button(
@@ -1251,8 +1747,11 @@ class TeleprompterWindow:
         font_up_btn.pack(side="left", padx=2)
 
         # Transparência
-        tk.Label(
-            config_frame, text="Opacidade:", bg=self.current_bg, fg=self.text_color
+        self._themed(
+            tk.Label(
+                config_frame, text="Opacidade:", bg=self.current_bg, fg=self.text_color
+            ),
+            with_fg=True,
         ).pack(side="left", padx=(10, 0))
 
         opacity_down_btn = tk.Button(
@@ -1271,9 +1770,8 @@ class TeleprompterWindow:
         )
         color_btn.pack(side="left", padx=(10, 0))
 
-        # Limpar
-        clear_btn = tk.Button(config_frame, text="🗑️", command=self._clear_text)
-        clear_btn.pack(side="left", padx=2)
+        # Sem botão de limpar: o texto é compartilhado com a GUI principal, e
+        # limpar aqui apagaria a transcrição e as estatísticas de lá
 
         # Alternar GUI principal
         toggle_gui_btn = tk.Button(
@@ -1282,7 +1780,7 @@ class TeleprompterWindow:
         toggle_gui_btn.pack(side="left", padx=2)
 
         # Área de texto
-        text_frame = tk.Frame(main_frame, bg=self.current_bg)
+        text_frame = self._themed(tk.Frame(main_frame, bg=self.current_bg))
         text_frame.pack(fill="both", expand=True, padx=5, pady=5)
         self.text_frame = text_frame  # Guardar referência
 
@@ -1290,10 +1788,20 @@ class TeleprompterWindow:
         scrollbar = tk.Scrollbar(text_frame)
         scrollbar.pack(side="right", fill="y")
 
-        # Widget de texto
-        self.text_widget = tk.Text(
+        # Widget de texto, com objeto de fonte reconfigurável
+        self._text_font = tkfont.Font(
+            root=self.root,
+            family=self.font_family,
+            size=self.font_size,
+            weight="bold",
+        )
+        # Peer da área de transcrições: compartilha o mesmo conteúdo do Tk,
+        # sem segunda cópia nem segunda inserção; só leitura por aqui
+        self.text_widget = _TextPeer(
             text_frame,
-            font=(self.font_family, self.font_size, "bold"),
+            self.parent.transcriptions_text,
+            state="disabled",
+            font=self._text_font,
             bg=self.current_bg,
             fg=self.text_color,
             insertbackground=self.text_color,
@@ -1307,40 +1815,69 @@ class TeleprompterWindow:
         scrollbar.config(command=self.text_widget.yview)
 
         # Vincular teclas
-        self.root.bind("<Escape>", lambda e: self.close())
-        self.root.bind("<Control-plus>", lambda e: self._increase_font())
-        self.root.bind("<Control-minus>", lambda e: self._decrease_font())
-        self.root.bind(
-            "<F2>", lambda e: self.parent.toggle_gui_visibility()
-        )  # F2 para alternar GUI
+        self.root.bind("<Escape>", self._on_escape)
+        self.root.bind("<Control-plus>", self._on_font_up_key)
+        self.root.bind("<Control-minus>", self._on_font_down_key)
+        self.root.bind("<F2>", self._on_toggle_gui_key)  # F2 para alternar GUI
+
+    def _on_escape(self, event):
+        """Fecha o teleprompter com Esc."""
+        self.close()
+
+    def _on_font_up_key(self, event):
+        """Aumenta a fonte com Ctrl-+."""
+        self._increase_font()
+
+    def _on_font_down_key(self, event):
+        """Diminui a fonte com Ctrl--."""
+        self._decrease_font()
+
+    def _on_toggle_gui_key(self, event):
+        """Alterna a GUI principal com F2."""
+        self.parent.toggle_gui_visibility()
 
     def _increase_font(self):
         """Aumenta o tamanho da fonte."""
         if self.font_size < 72:
             self.font_size += 2
-            self._update_font()
+            self._schedule_font_update()
 
     def _decrease_font(self):
         """Diminui o tamanho da fonte."""
         if self.font_size > 12:
             self.font_size -= 2
-            self._update_font()
+            self._schedule_font_update()
+
+    def _schedule_font_update(self):
+        """Agrupa cliques rápidos numa única troca de fonte."""
+        if self._pending_font_after_id is not None:
+            self.root.after_cancel(self._pending_font_after_id)
+        self._pending_font_after_id = self.root.after(50, self._update_font)
 
     def _update_font(self):
         """Atualiza a fonte do texto."""
-        self.text_widget.config(font=(self.font_family, self.font_size, "bold"))
+        self._pending_font_after_id = None
+        self._text_font.configure(size=self.font_size)
+
+    def _schedule_transparency_update(self):
+        """Agrupa cliques rápidos numa única troca de transparência."""
+        if self._pending_transparency_after_id is not None:
+            self.root.after_cancel(self._pending_transparency_after_id)
+        self._pending_transparency_after_id = self.root.after(
+            50, self._update_transparency
+        )
 
     def _increase_opacity(self):
         """Aumenta a opacidade."""
         if self.transparency < 1.0:
             self.transparency += 0.1
-            self._update_transparency()
+            self._schedule_transparency_update()
 
     def _decrease_opacity(self):
         """Diminui a opacidade."""
         if self.transparency > 0.2:
             self.transparency -= 0.1
-            self._update_transparency()
+            self._schedule_transparency_update()
 
     def _toggle_transparency(self):
         """Alterna entre alta e baixa transparência rapidamente."""
@@ -1352,8 +1889,6 @@ class TeleprompterWindow:
 
     def _change_colors(self):
         """Abre diálogo para mudar cores."""
-        from tkinter import colorchooser
-
         # Escolher cor do fundo
         bg_color = colorchooser.askcolor(
             title="Escolher cor de fundo", initialcolor=self.bg_color
@@ -1379,43 +1914,22 @@ class TeleprompterWindow:
         self._update_transparency()
 
         # Atualizar widget de texto
-        if hasattr(self, "text_widget"):
+        if self.text_widget is not None:
             self.text_widget.config(
                 bg=self.current_bg, fg=self.text_color, insertbackground=self.text_color
             )
 
-        # Atualizar containers e frames principais
-        if hasattr(self, "main_container"):
-            self.main_container.configure(bg=self.current_bg)
-        if hasattr(self, "main_frame"):
-            self.main_frame.configure(bg=self.current_bg)
-        if hasattr(self, "controls_frame"):
-            self.controls_frame.configure(bg=self.current_bg)
-        if hasattr(self, "config_frame"):
-            self.config_frame.configure(bg=self.current_bg)
-        if hasattr(self, "text_frame"):
-            self.text_frame.configure(bg=self.current_bg)
-
-        # Atualizar labels recursivamente
-        self._update_widget_colors(self.root)
-
-    def _update_widget_colors(self, widget):
-        """Atualiza cores de widgets recursivamente."""
-        try:
-            if isinstance(widget, tk.Label):
+        # Atualizar frames e labels registrados, sem percorrer a árvore
+        for widget, with_fg in self._themed_widgets:
+            if with_fg:
                 widget.configure(bg=self.current_bg, fg=self.text_color)
-            elif isinstance(widget, tk.Frame):
+            else:
                 widget.configure(bg=self.current_bg)
 
-            # Atualizar filhos
-            for child in widget.winfo_children():
-                self._update_widget_colors(child)
-        except:
-            pass
-
-    def _clear_text(self):
-        """Limpa o texto do teleprompter."""
-        self.text_widget.delete(1.0, tk.END)
+    def _themed(self, widget, with_fg: bool = False):
+        """Registra um widget para receber as cores do tema."""
+        self._themed_widgets.append((widget, with_fg))
+        return widget
 
     def close(self):
         """Fecha a janela do teleprompter."""
@@ -1424,3 +1938,9 @@ class TeleprompterWindow:
     def destroy(self):
         """Destrói a janela."""
         self.root.destroy()
+
+    def _on_destroy(self, event):
+        """Avisa a interface quando a janela é destruída por qualquer caminho."""
+        # Filhos herdam o bindtag do Toplevel; só o próprio Toplevel interessa
+        if event.widget is self.root:
+            self.parent._on_teleprompter_destroyed(self)
@@ -5,9 +5,11 @@ Interface interativa com rich para visualização em tempo real.
 import logging
 import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +32,67 @@ class AppStats:
     start_time: datetime = field(default_factory=datetime.now)
     total_transcriptions: int = 0
     languages_detected: Dict[str, int] = field(default_factory=dict)
+    top_language: Optional[str] = None
+    top_language_count: int = 0
     translation_count: int = 0
-    average_confidence: float = 0.0
+    confidence_sum: float = 0.0
+    confidence_count: int = 0
     current_audio_level: float = 0.0
     processing_time_avg: float = 0.0
 
+    @property
+    def average_confidence(self) -> float:
+        """Confiança média das transcrições que informaram confiança."""
+        if not self.confidence_count:
+            return 0.0
+        return self.confidence_sum / self.confidence_count
+
+
+# Bandeira exibida para cada código de idioma
+_LANG_FLAGS = {
+    "pt": "🇧🇷",
+    "en": "🇺🇸",
+    "es": "🇪🇸",
+    "fr": "🇫🇷",
+    "de": "🇩🇪",
+    "it": "🇮🇹",
+    "ja": "🇯🇵",
+    "ko": "🇰🇷",
+    "zh": "🇨🇳",
+    "ru": "🇷🇺",
+    "ar": "🇸🇦",
+    "hi": "🇮🇳",
+    "nl": "🇳🇱",
+    "sv": "🇸🇪",
+    "no": "🇳🇴",
+    "da": "🇩🇰",
+    "fi": "🇫🇮",
+    "pl": "🇵🇱",
+    "tr": "🇹🇷",
+    "bg": "🇧🇬",
+    "nn": "🇳🇴",
+}
+
+# Barras de nível pré-montadas, indexadas pelo número de blocos preenchidos
+_BAR_WIDTH = 30
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+
+class _BufferHandler(logging.Handler):
+    """Guarda logs num buffer limitado enquanto o Live ocupa a tela."""
+
+    def __init__(self, buffer: Deque[str], on_emit):
+        super().__init__(level=logging.WARNING)
+        self.buffer = buffer
+        self.on_emit = on_emit
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(f"{record.levelname}: {record.getMessage()}")
+            self.on_emit()
+        except Exception:
+            self.handleError(record)
+
 
 try:
     from rich import box
@@ -43,6 +101,7 @@ try:
     from rich.console import Console
     from rich.layout import Layout
     from rich.live import Live
+    from rich.markup import escape
     from rich.panel import Panel
     from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
     from rich.table import Table
@@ -53,18 +112,50 @@ try:
     class InteractiveConsole:
         """Console interativo com rich para visualização em tempo real."""
 
+        # Seções do layout, na ordem em que são renderizadas
+        _SECTIONS = (
+            "header",
+            "transcriptions",
+            "audio_status",
+            "config",
+            "stats",
+            "footer",
+        )
+
+        # Intervalo mínimo entre redesenhos, para agrupar rajadas de eventos
+        _MIN_RENDER_INTERVAL = 0.1
+
         def __init__(self, config):
             self.config = config
             self.stats = AppStats()
-            self.recent_transcriptions: List[TranscriptionEntry] = []
             self.max_recent = 10
+            self.recent_transcriptions: Deque[TranscriptionEntry] = deque(
+                maxlen=self.max_recent
+            )
 
             # Estado da aplicação
             self.running = False
             self.live_display = None
             self.update_thread = None
+            # Protege transcrições e estatísticas (o nível de áudio não usa lock)
             self.lock = threading.Lock()
 
+            # Seções marcadas como sujas pelos mutadores e último Panel de cada uma
+            self._dirty = dict.fromkeys(self._SECTIONS, True)
+            self._panels: Dict[str, Panel] = {}
+            self._last_uptime_secs = -1
+
+            # Cópia do estado lida pelos renderizadores, fora do lock
+            self._view_entries: List[TranscriptionEntry] = []
+            self._view_stats = self.stats
+
+            # Acorda o loop de atualização quando algo muda; sem mudanças ele dorme
+            self._dirty_event = threading.Event()
+            self._stop_event = threading.Event()
+
+            # Avisos e erros de log durante o Live, exibidos no rodapé
+            self._errors: Deque[str] = deque(maxlen=50)
+
             # Console rich
             self.console = Console()
             self.progress = Progress(
@@ -75,6 +166,9 @@ try:
             )
             self.setup_layout()
 
+            # Configuração não muda durante a sessão: o painel é montado uma vez
+            self._config_panel = self._build_config_panel()
+
         def setup_layout(self):
             """Configura o layout da interface."""
             self.layout = Layout()
@@ -107,6 +201,8 @@ try:
         def start(self):
             """Inicia a interface interativa."""
             self.running = True
+            self._stop_event.clear()
+            self._mark_dirty("audio_status")
 
             # Thread para atualização da interface
             self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
@@ -117,22 +213,46 @@ try:
                 self.layout,
                 console=self.console,
                 screen=True,
-                redirect_stderr=True,
-                redirect_stdout=True,
+                redirect_stderr=False,
+                redirect_stdout=False,
             )
 
+            # Handlers de console escreveriam direto na tela alternativa e
+            # corromperiam o layout: enquanto o Live está ativo, o log vai para
+            # o buffer exibido no rodapé (handlers de arquivo seguem intactos)
+            root_logger = logging.getLogger()
+            console_handlers = [
+                handler
+                for handler in root_logger.handlers
+                if isinstance(handler, logging.StreamHandler)
+                and not isinstance(handler, logging.FileHandler)
+            ]
+            buffer_handler = _BufferHandler(
+                self._errors, lambda: self._mark_dirty("footer")
+            )
+            for handler in console_handlers:
+                root_logger.removeHandler(handler)
+            root_logger.addHandler(buffer_handler)
+
             try:
                 with self.live_display:
                     # Não imprimir nada durante o Live display para evitar flickers
                     while self.running:
-                        time.sleep(0.1)
+                        self._stop_event.wait(timeout=1.0)
 
             except KeyboardInterrupt:
                 self.running = False
 
+            finally:
+                root_logger.removeHandler(buffer_handler)
+                for handler in console_handlers:
+                    root_logger.addHandler(handler)
+
         def stop(self):
             """Para a interface."""
             self.running = False
+            self._mark_dirty("audio_status")
+            self._stop_event.set()
             if self.update_thread:
                 self.update_thread.join(timeout=1.0)
 
@@ -144,44 +264,47 @@ try:
             translation: str = None,
         ):
             """Adiciona nova transcrição."""
-            with self.lock:
-                entry = TranscriptionEntry(
-                    timestamp=datetime.now(),
-                    text=text,
-                    language=language,
-                    confidence=confidence,
-                    translation=translation,
-                )
+            entry = TranscriptionEntry(
+                timestamp=datetime.now(),
+                text=text,
+                language=language,
+                confidence=confidence,
+                translation=translation,
+            )
 
+            with self.lock:
                 self.recent_transcriptions.append(entry)
-                if len(self.recent_transcriptions) > self.max_recent:
-                    self.recent_transcriptions.pop(0)
 
                 # Atualiza estatísticas
                 self.stats.total_transcriptions += 1
-                if language in self.stats.languages_detected:
-                    self.stats.languages_detected[language] += 1
-                else:
-                    self.stats.languages_detected[language] = 1
+                count = self.stats.languages_detected.get(language, 0) + 1
+                self.stats.languages_detected[language] = count
+                if count > self.stats.top_language_count:
+                    self.stats.top_language = language
+                    self.stats.top_language_count = count
 
                 if translation:
                     self.stats.translation_count += 1
 
-                # Atualiza confiança média
+                self._dirty["transcriptions"] = True
+                self._dirty["stats"] = True
+                self._dirty["footer"] = True
+                self._dirty_event.set()
+
+                # Soma acumulada; a média é derivada só na renderização
                 if confidence > 0:
-                    total_confidence = (
-                        self.stats.average_confidence
-                        * (self.stats.total_transcriptions - 1)
-                        + confidence
-                    )
-                    self.stats.average_confidence = (
-                        total_confidence / self.stats.total_transcriptions
-                    )
+                    self.stats.confidence_sum += confidence
+                    self.stats.confidence_count += 1
 
         def update_audio_level(self, level: float):
-            """Atualiza nível de áudio atual."""
-            with self.lock:
-                self.stats.current_audio_level = level
+            """Atualiza nível de áudio atual.
+
+            Chamado em alta frequência pela thread de áudio: atribuições simples
+            são atômicas no CPython, então não disputa o lock com a renderização.
+            """
+            self.stats.current_audio_level = level
+            self._dirty["audio_status"] = True
+            self._dirty_event.set()
 
         def update_last_translation(self, translation: str):
             """Atualiza a tradução da última transcrição."""
@@ -189,6 +312,9 @@ try:
                 if self.recent_transcriptions:
                     self.recent_transcriptions[-1].translation = translation
                     self.stats.translation_count += 1
+                    self._dirty["transcriptions"] = True
+                    self._dirty["stats"] = True
+                    self._dirty_event.set()
 
         def set_audio_device(self, device_name: str):
             """Define o nome do dispositivo de áudio ativo."""
@@ -200,59 +326,87 @@ try:
             pass
 
         def _update_loop(self):
-            """Loop de atualização da interface."""
+            """Loop de atualização da interface.
+
+            Dorme até um mutador sinalizar mudança; o timeout de 1s mantém o
+            uptime do header atualizado mesmo sem atividade.
+            """
             while self.running:
                 try:
+                    self._dirty_event.wait(timeout=1.0)
+                    self._dirty_event.clear()
+                    if not self.running:
+                        break
                     self._update_display()
-                    time.sleep(0.5)  # Atualiza 2x por segundo
                 except Exception as e:
                     logger.error(f"Erro na atualização da interface: {e}")
+                time.sleep(self._MIN_RENDER_INTERVAL)
+
+        def _mark_dirty(self, *sections: str):
+            """Marca seções para serem redesenhadas no próximo ciclo."""
+            with self.lock:
+                for section in sections:
+                    self._dirty[section] = True
+            self._dirty_event.set()
 
         def _update_display(self):
-            """Atualiza o display da interface."""
+            """Atualiza o display da interface, redesenhando só as seções sujas."""
             if not self.layout:
                 return
 
-            # Header
+            # O header só muda quando o segundo do uptime avança
             uptime = datetime.now() - self.stats.start_time
+            uptime_secs = int(uptime.total_seconds())
+
+            with self.lock:
+                if uptime_secs != self._last_uptime_secs:
+                    self._last_uptime_secs = uptime_secs
+                    self._dirty["header"] = True
+                dirty = [name for name in self._SECTIONS if self._dirty[name]]
+                for name in dirty:
+                    self._dirty[name] = False
+                if not dirty:
+                    return
+                self._view_entries = list(self.recent_transcriptions)
+                # Cópia rasa: a renderização não lê languages_detected
+                self._view_stats = replace(self.stats)
+
+            # Renderiza fora do lock, a partir da cópia
+            for name in dirty:
+                panel = getattr(self, f"_render_{name}")()
+                self._panels[name] = panel
+                self.layout[name].update(panel)
+
+        def _render_header(self) -> Panel:
+            """Renderiza o cabeçalho com o tempo ativo."""
+            secs = self._last_uptime_secs
+            uptime = f"{secs // 3600:02d}:{secs // 60 % 60:02d}:{secs % 60:02d}"
             header_text = Text.assemble(
                 ("🎙️ Whisper Transcriber", "bold green"),
-                f" • Ativo há {str(uptime).split('.')[0]}",
-            )
-            self.layout["header"].update(
-                Panel(Align.center(header_text), box=box.ROUNDED)
+                f" • Ativo há {uptime}",
             )
+            return Panel(Align.center(header_text), box=box.ROUNDED)
 
-            # Transcrições recentes
-            self.layout["transcriptions"].update(self._render_transcriptions())
-
-            # Status de áudio
-            self.layout["audio_status"].update(self._render_audio_status())
-
-            # Configurações
-            self.layout["config"].update(self._render_config())
-
-            # Estatísticas
-            self.layout["stats"].update(self._render_stats())
-
-            # Footer
+        def _render_footer(self) -> Panel:
+            """Renderiza o rodapé com o total de transcrições."""
             footer_text = Text.assemble(
                 ("Ctrl+C", "bold red"),
                 " para sair • ",
                 ("Transcrições: ", ""),
-                (str(self.stats.total_transcriptions), "bold cyan"),
-            )
-            self.layout["footer"].update(
-                Panel(Align.center(footer_text), box=box.ROUNDED)
+                (str(self._view_stats.total_transcriptions), "bold cyan"),
             )
+            if self._errors:
+                footer_text.append(f" • ⚠️ {self._errors[-1]}", style="red")
+            return Panel(Align.center(footer_text), box=box.ROUNDED)
 
         def _render_transcriptions(self) -> Panel:
             """Renderiza painel de transcrições."""
-            if not self.recent_transcriptions:
+            if not self._view_entries:
                 content = "[dim]Aguardando transcrições...[/dim]"
             else:
                 lines = []
-                for entry in reversed(self.recent_transcriptions[-5:]):  # Últimas 5
+                # Últimas 5, da mais recente para a mais antiga
+                for entry in islice(reversed(self._view_entries), 5):
                     time_str = entry.timestamp.strftime("%H:%M:%S")
                     lang_flag = self._get_language_flag(entry.language)
 
@@ -266,26 +420,23 @@ try:
                         f"({entry.confidence:.1f})" if entry.confidence > 0 else ""
                     )
 
-                    line = Text.assemble(
-                        (f"[{time_str}] ", "dim"),
-                        (lang_flag, ""),
-                        (f" {entry.text}", "white"),
-                        (f" {confidence_str}", confidence_color),
+                    # Markup direto: o texto do usuário é escapado
+                    lines.append(
+                        f"[dim]\\[{time_str}][/dim] {lang_flag}"
+                        f" [white]{escape(entry.text)}[/white]"
+                        f" [{confidence_color}]{confidence_str}[/{confidence_color}]"
                     )
-                    lines.append(line)
 
                     # Tradução se disponível
                     if entry.translation:
-                        translation_line = Text.assemble(
-                            ("         ", ""),
-                            ("🔄 ", "blue"),
-                            (entry.translation, "cyan"),
+                        lines.append(
+                            f"         [blue]🔄[/blue] "
+                            f"[cyan]{escape(entry.translation)}[/cyan]"
                         )
-                        lines.append(translation_line)
 
-                    lines.append(Text(""))  # Linha vazia
+                    lines.append("")  # Linha vazia
 
-                content = "\n".join(str(line) for line in lines)
+                content = Text.from_markup("\n".join(lines))
 
             return Panel(
                 content,
@@ -297,10 +448,8 @@ try:
         def _render_audio_status(self) -> Panel:
             """Renderiza status de áudio."""
             # Barra de nível de áudio
-            level = self.stats.current_audio_level
-            bar_width = 30
-            filled = int(level * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
+            level = self._view_stats.current_audio_level
+            bar = _BARS[max(0, min(_BAR_WIDTH, int(level * _BAR_WIDTH)))]
 
             # Cor baseada no nível
             if level > 0.7:
@@ -310,16 +459,12 @@ try:
             else:
                 color = "green"
 
-            content = Text.assemble(
-                ("Nível: ", "white"),
-                (f"[{bar}]", color),
-                (f" {level:.1%}", "white"),
-                ("\n\n", ""),
-                ("Status: ", "white"),
-                (
-                    "🟢 Ativo" if self.running else "🔴 Parado",
-                    "green" if self.running else "red",
-                ),
+            status = (
+                "[green]🟢 Ativo[/green]" if self.running else "[red]🔴 Parado[/red]"
+            )
+            content = Text.from_markup(
+                f"[white]Nível:[/white] [{color}]\\[{bar}][/{color}]"
+                f" [white]{level:.1%}[/white]\n\n[white]Status:[/white] {status}"
             )
 
             return Panel(
@@ -329,8 +474,17 @@ try:
                 box=box.ROUNDED,
             )
 
+        def refresh_config(self):
+            """Remonta o painel de configurações após mudança em execução."""
+            self._config_panel = self._build_config_panel()
+            self._mark_dirty("config")
+
         def _render_config(self) -> Panel:
-            """Renderiza configurações ativas."""
+            """Retorna o painel de configurações já montado."""
+            return self._config_panel
+
+        def _build_config_panel(self) -> Panel:
+            """Monta o painel de configurações ativas."""
             audio_cfg = self.config.audio
             trans_cfg = self.config.transcription
 
@@ -352,24 +506,22 @@ try:
 
         def _render_stats(self) -> Panel:
             """Renderiza estatísticas."""
+            stats = self._view_stats
             table = Table(show_header=False, box=None, padding=(0, 1))
             table.add_column("Stat", style="dim")
             table.add_column("Value", style="cyan")
 
             # Estatísticas básicas
-            table.add_row("Total:", str(self.stats.total_transcriptions))
-            table.add_row("Traduções:", str(self.stats.translation_count))
+            table.add_row("Total:", str(stats.total_transcriptions))
+            table.add_row("Traduções:", str(stats.translation_count))
 
-            if self.stats.average_confidence > 0:
-                table.add_row("Confiança:", f"{self.stats.average_confidence:.1%}")
+            if stats.average_confidence > 0:
+                table.add_row("Confiança:", f"{stats.average_confidence:.1%}")
 
             # Idiomas mais detectados
-            if self.stats.languages_detected:
-                top_lang = max(
-                    self.stats.languages_detected.items(), key=lambda x: x[1]
-                )
-                flag = self._get_language_flag(top_lang[0])
-                table.add_row("Top idioma:", f"{flag} {top_lang[1]}x")
+            if stats.top_language is not None:
+                flag = self._get_language_flag(stats.top_language)
+                table.add_row("Top idioma:", f"{flag} {stats.top_language_count}x")
 
             return Panel(
                 table, title="📊 Estatísticas", border_style="magenta", box=box.ROUNDED
@@ -377,30 +529,7 @@ try:
 
         def _get_language_flag(self, lang_code: str) -> str:
             """Retorna emoji da bandeira para o idioma."""
-            flags = {
-                "pt": "🇧🇷",
-                "en": "🇺🇸",
-                "es": "🇪🇸",
-                "fr": "🇫🇷",
-                "de": "🇩🇪",
-                "it": "🇮🇹",
-                "ja": "🇯🇵",
-                "ko": "🇰🇷",
-                "zh": "🇨🇳",
-                "ru": "🇷🇺",
-                "ar": "🇸🇦",
-                "hi": "🇮🇳",
-                "nl": "🇳🇱",
-                "sv": "🇸🇪",
-                "no": "🇳🇴",
-                "da": "🇩🇰",
-                "fi": "🇫🇮",
-                "pl": "🇵🇱",
-                "tr": "🇹🇷",
-                "bg": "🇧🇬",
-                "nn": "🇳🇴",
-            }
-            return flags.get(lang_code, "🌐")
+            return _LANG_FLAGS.get(lang_code, "🌐")
 
 except ImportError:
     RICH_AVAILABLE = False
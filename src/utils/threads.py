@@ -0,0 +1,18 @@
+"""
+Thread budget utilities
+"""
+
+import os
+
+
+def half_cpu_count() -> int:
+    """
+    Número de threads para cada motor de inferência.
+
+    Whisper (CTranslate2) e a tradução (PyTorch/ONNX Runtime) rodam ao mesmo
+    tempo, então cada um fica com metade dos núcleos.
+
+    Returns:
+        Metade dos núcleos disponíveis (no mínimo 1)
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
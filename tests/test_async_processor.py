@@ -0,0 +1,38 @@
+"""
+Unit tests for the asynchronous transcription processor
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.transcription.async_processor import AsyncTranscriptionProcessor
+
+
+class TestAudioQueueBackPressure(unittest.TestCase):
+    """Test cases for the audio queue back-pressure policy"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(AsyncTranscriptionProcessor, '_setup_transcription_backup'):
+            self.processor = AsyncTranscriptionProcessor(transcriber=MagicMock())
+
+    def test_full_queue_drops_oldest_chunk(self):
+        """Test that a full queue evicts the oldest chunk and keeps the newest"""
+        maxlen = self.processor.audio_queue.maxlen
+
+        for i in range(maxlen + 3):
+            self.assertTrue(self.processor.add_audio_chunk(i, 16000))
+
+        self.assertEqual(self.processor.get_queue_size(), maxlen)
+        queued = [chunk for chunk, _ in self.processor.audio_queue]
+        self.assertEqual(queued[0], 3)
+        self.assertEqual(queued[-1], maxlen + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Unit tests for the translation manager
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.translation.engines import TranslationManager, TranslationResult
+from src.transcription.async_processor import AsyncTranscriptionProcessor
+
+
+class TestIdentityTranslation(unittest.TestCase):
+    """Test cases for translations identical to the original text"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(TranslationManager, '_setup_translators'):
+            self.manager = TranslationManager(mode="google", target_language="pt")
+        self.manager.primary_translator = MagicMock()
+
+    def test_same_language_returns_none(self):
+        """Test that text already in the target language is not translated"""
+        self.assertIsNone(self.manager.translate("Olá mundo", "pt-BR"))
+        self.manager.primary_translator.translate.assert_not_called()
+
+    def test_identical_result_returns_none(self):
+        """Test that a translator echoing the input is treated as no translation"""
+        self.manager.primary_translator.translate.return_value = TranslationResult(
+            "OK", source_language="en"
+        )
+        self.assertIsNone(self.manager.translate("OK", "en"))
+
+    def test_identical_result_is_not_saved_or_shown(self):
+        """Test that an identity result writes no duplicate backup line"""
+        with patch.object(AsyncTranscriptionProcessor, '_setup_transcription_backup'):
+            processor = AsyncTranscriptionProcessor(
+                transcriber=MagicMock(),
+                translation_manager=self.manager,
+                ui=MagicMock(),
+            )
+
+        with patch.object(processor, '_save_transcription') as mock_save:
+            processor._translate_async("Olá mundo", "pt")
+
+        mock_save.assert_not_called()
+        processor.ui.update_last_translation.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
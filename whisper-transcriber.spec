@@ -44,7 +44,6 @@ hiddenimports = [
     'numpy',
     'googletrans',
     'webrtcvad',
-    'soundfile',
     'tkinter',
     'tkinter.ttk',
     'tkinter.filedialog',